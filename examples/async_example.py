@@ -2,6 +2,7 @@
 
 import os
 import asyncio
+import random
 from jules_agent_sdk import AsyncJulesClient
 from jules_agent_sdk.models import SessionState
 
@@ -14,34 +15,36 @@ async def monitor_session(client, session_id):
     """Monitor a session and print progress updates."""
     print(f"\n[{session_id}] Monitoring session...")
 
+    # Back off while nothing changes, poll quickly again after a transition
+    delay = 1.0
+    last_state = None
+
     while True:
         session = await client.sessions.get(session_id)
         print(f"[{session_id}] State: {session.state}")
 
-        if session.state in [SessionState.COMPLETED, SessionState.FAILED]:
+        if session.state in {SessionState.COMPLETED, SessionState.FAILED}:
             return session
 
-        await asyncio.sleep(5)
+        delay = min(delay * 2, 10.0) if session.state == last_state else 1.0
+        last_state = session.state
+        await asyncio.sleep(delay * random.uniform(0.9, 1.1))
 
 
-async def create_and_track_session(client, prompt, source):
+async def create_and_track_session(client, watcher, create_limit, prompt, source):
     """Create a session and track it to completion."""
     print(f"\nCreating session: {prompt[:50]}...")
 
-    session = await client.sessions.create(
-        prompt=prompt, source=source, starting_branch="main"
-    )
+    # Bound the number of concurrent create calls
+    async with create_limit:
+        session = await client.sessions.create(
+            prompt=prompt, source=source, starting_branch="main"
+        )
 
     print(f"Session created: {session.id}")
 
-    # Wait for completion
-    final_session = await client.sessions.wait_for_completion(session.id)
-
-    # Get activities
-    activities = await client.activities.list_all(session.id)
-    print(f"Session {session.id} completed with {len(activities)} activities")
-
-    return final_session
+    # Wait for completion; one shared watcher polls all tracked sessions
+    return await watcher.wait(session.id)
 
 
 async def main():
@@ -58,38 +61,51 @@ async def main():
             return
 
         source_id = sources[0].name
+        watcher = client.sessions.watch()
+        create_limit = asyncio.Semaphore(8)
 
         # Example 1: Single session
         print("\n=== Example 1: Single Session ===")
-        await create_and_track_session(
+        session = await create_and_track_session(
             client=client,
+            watcher=watcher,
+            create_limit=create_limit,
             prompt="Add comprehensive error handling to the API endpoints",
             source=source_id,
         )
+        activities = await client.activities.list_all(session.id)
+        print(f"Session {session.id} completed with {len(activities)} activities")
 
         # Example 2: Multiple concurrent sessions
         print("\n=== Example 2: Concurrent Sessions ===")
+        prompts = [
+            "Improve database query performance",
+            "Add unit tests for authentication module",
+            "Update documentation with latest API changes",
+        ]
         tasks = [
-            create_and_track_session(
-                client, "Improve database query performance", source_id
-            ),
-            create_and_track_session(
-                client, "Add unit tests for authentication module", source_id
-            ),
-            create_and_track_session(
-                client, "Update documentation with latest API changes", source_id
-            ),
+            create_and_track_session(client, watcher, create_limit, prompt, source_id)
+            for prompt in prompts
         ]
 
         # Run all sessions concurrently
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
+        await watcher.close()
+
+        # Fetch activities for all completed sessions concurrently
+        completed = [r for r in results if not isinstance(r, Exception)]
+        activities_by_session = await client.activities.list_all_many(
+            session.id for session in completed
+        )
+
         print("\n=== Results ===")
         for i, result in enumerate(results):
             if isinstance(result, Exception):
                 print(f"Task {i+1} failed: {result}")
             else:
-                print(f"Task {i+1} completed: {result.state}")
+                activities = activities_by_session[result.id]
+                print(f"Task {i+1} completed: {result.state} ({len(activities)} activities)")
 
         # Example 3: List all sessions
         print("\n=== Example 3: List All Sessions ===")
@@ -99,4 +115,13 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop (optional, `pip install uvloop`) cuts event-loop overhead when
+    # many sessions are tracked concurrently; it is a drop-in replacement.
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
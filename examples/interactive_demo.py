@@ -2,6 +2,7 @@
 """Interactive demo showing all SDK features."""
 
 import os
+import sys
 from jules_agent_sdk import JulesClient
 from jules_agent_sdk.exceptions import JulesAPIError
 
@@ -127,7 +128,7 @@ def demo_activities(client, session):
             # Find a completed session with activities
             recent = client.sessions.list(page_size=20)
             for s in recent["sessions"]:
-                if s.state.value in ["COMPLETED", "FAILED", "IN_PROGRESS"]:
+                if s.state.value in {"COMPLETED", "FAILED", "IN_PROGRESS"}:
                     try:
                         print(f"   Checking session {s.id}...")
                         test_activities = client.activities.list(s.id, page_size=5)
@@ -151,44 +152,47 @@ def demo_activities(client, session):
 
     print(f"✅ Found {len(activities)} activities\n")
 
-    # Show activity details
+    # Show activity details; each activity is written to stdout in one call
     for i, activity in enumerate(activities[:5], 1):
-        print(f"{i}. Activity {activity.id}")
-        print(f"   Description: {activity.description}")
-        print(f"   Originator: {activity.originator}")
-        print(f"   Created: {activity.create_time}")
+        lines = [
+            f"{i}. Activity {activity.id}",
+            f"   Description: {activity.description}",
+            f"   Originator: {activity.originator}",
+            f"   Created: {activity.create_time}",
+        ]
 
         # Show activity type
         if activity.agent_messaged:
             msg = activity.agent_messaged.get("agentMessage", "")
-            print(f"   Type: Agent Message")
-            print(f"   Content: {msg[:100]}{'...' if len(msg) > 100 else ''}")
+            lines.append(f"   Type: Agent Message")
+            lines.append(f"   Content: {msg[:100]}{'...' if len(msg) > 100 else ''}")
 
         elif activity.plan_generated:
             plan = activity.plan_generated.get("plan", {})
             steps = plan.get("steps", [])
-            print(f"   Type: Plan Generated")
-            print(f"   Steps: {len(steps)}")
+            lines.append(f"   Type: Plan Generated")
+            lines.append(f"   Steps: {len(steps)}")
             for step in steps[:2]:
-                print(f"      - {step.get('title', 'N/A')}")
+                lines.append(f"      - {step.get('title', 'N/A')}")
 
         elif activity.progress_updated:
             update = activity.progress_updated
-            print(f"   Type: Progress Update")
-            print(f"   Title: {update.get('title', 'N/A')}")
+            lines.append(f"   Type: Progress Update")
+            lines.append(f"   Title: {update.get('title', 'N/A')}")
 
         # Show artifacts
         if activity.artifacts:
-            print(f"   Artifacts: {len(activity.artifacts)}")
+            lines.append(f"   Artifacts: {len(activity.artifacts)}")
             for artifact in activity.artifacts[:2]:
                 if artifact.change_set:
-                    print(f"      - Code changes")
+                    lines.append(f"      - Code changes")
                 if artifact.bash_output:
-                    print(f"      - Bash output: {artifact.bash_output.command}")
+                    lines.append(f"      - Bash output: {artifact.bash_output.command}")
 
-        print()
+        sys.stdout.write("\n".join(lines) + "\n\n")
+    sys.stdout.flush()
 
-    # Get a specific activity
+    # Get a specific activity (answered from the cache filled by list())
     if activities:
         activity = activities[0]
         print(f"Retrieving specific activity: {activity.id}")
@@ -1,7 +1,7 @@
 """Example showing how to handle plan approval workflows."""
 
 import os
-import time
+import sys
 from jules_agent_sdk import JulesClient
 from jules_agent_sdk.models import SessionState
 
@@ -29,19 +29,16 @@ def main():
 
         # Poll until we get to the plan approval stage
         print("\n=== Waiting for Plan Generation ===")
-        while True:
-            session = client.sessions.get(session.id)
+        for session in client.sessions.subscribe(session.id):
             print(f"Current state: {session.state}")
 
             if session.state == SessionState.AWAITING_PLAN_APPROVAL:
                 print("\n✓ Plan has been generated and is awaiting approval!")
                 break
-            elif session.state in [SessionState.FAILED, SessionState.COMPLETED]:
+            elif session.state in {SessionState.FAILED, SessionState.COMPLETED}:
                 print(f"Session ended unexpectedly with state: {session.state}")
                 return
 
-            time.sleep(3)
-
         # Retrieve and display the plan
         print("\n=== Generated Plan ===")
         activities = client.activities.list_all(session.id)
@@ -53,13 +50,13 @@ def main():
                 plan_id = plan_data.get("id")
                 steps = plan_data.get("steps", [])
 
-                print(f"\nPlan ID: {plan_id}")
-                print(f"Total Steps: {len(steps)}\n")
-
+                # Write the whole plan in one call instead of one print per line
+                lines = [f"\nPlan ID: {plan_id}", f"Total Steps: {len(steps)}\n"]
                 for step in steps:
-                    print(f"Step {step['index'] + 1}: {step['title']}")
-                    print(f"  Description: {step['description']}")
-                    print()
+                    lines.append(f"Step {step['index'] + 1}: {step['title']}")
+                    lines.append(f"  Description: {step['description']}\n")
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
 
                 plan_found = True
                 break
@@ -0,0 +1,20 @@
+"""Setup script for jules-agent-sdk.
+
+Project metadata lives in pyproject.toml. This script only adds an optional
+mypyc-compiled build of the pagination hot path; set ``JULES_SDK_MYPYC=1`` (with
+mypy installed) to enable it. Without the variable a pure-Python package is built.
+"""
+
+import os
+from setuptools import setup
+
+# Modules compiled to native extensions when JULES_SDK_MYPYC=1
+MYPYC_MODULES = ["src/jules_agent_sdk/activities.py"]
+
+ext_modules = []
+if os.environ.get("JULES_SDK_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(MYPYC_MODULES)
+
+setup(ext_modules=ext_modules)
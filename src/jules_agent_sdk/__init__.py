@@ -1,14 +1,18 @@
 """Jules Agent SDK - A user-friendly Python SDK for the Jules API."""
 
-from jules_agent_sdk.client import JulesClient
-from jules_agent_sdk.async_client import AsyncJulesClient
-from jules_agent_sdk.exceptions import (
-    JulesAPIError,
-    JulesAuthenticationError,
-    JulesNotFoundError,
-    JulesValidationError,
-    JulesRateLimitError,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from jules_agent_sdk.client import JulesClient
+    from jules_agent_sdk.async_client import AsyncJulesClient
+    from jules_agent_sdk.exceptions import (
+        JulesAPIError,
+        JulesAuthenticationError,
+        JulesNotFoundError,
+        JulesValidationError,
+        JulesRateLimitError,
+    )
 
 __version__ = "0.1.0"
 __all__ = [
@@ -20,3 +24,31 @@ __all__ = [
     "JulesValidationError",
     "JulesRateLimitError",
 ]
+
+# Public names are imported on first access so that importing the package does
+# not pull in requests/aiohttp until a client is actually used.
+_LAZY_IMPORTS = {
+    "JulesClient": "jules_agent_sdk.client",
+    "AsyncJulesClient": "jules_agent_sdk.async_client",
+    "JulesAPIError": "jules_agent_sdk.exceptions",
+    "JulesAuthenticationError": "jules_agent_sdk.exceptions",
+    "JulesNotFoundError": "jules_agent_sdk.exceptions",
+    "JulesValidationError": "jules_agent_sdk.exceptions",
+    "JulesRateLimitError": "jules_agent_sdk.exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
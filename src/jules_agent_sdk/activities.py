@@ -1,8 +1,9 @@
 """Activities API module."""
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from jules_agent_sdk.models import Activity
-from jules_agent_sdk.base import BaseClient
+from jules_agent_sdk.base import BaseClient, _normalize_session
+from jules_agent_sdk.cache import ACTIVITY_CACHE_TTL, LIST_CACHE_TTL
 
 
 class ActivitiesAPI:
@@ -30,11 +31,8 @@ class ActivitiesAPI:
             >>> activity = client.activities.get("session123", "activity456")
             >>> print(activity.description)
         """
-        if not session_id.startswith("sessions/"):
-            session_id = f"sessions/{session_id}"
-
-        path = f"{session_id}/activities/{activity_id}"
-        response = self.client.get(path)
+        path = _normalize_session(session_id) + "/activities/" + activity_id
+        response = self.client.get(path, cache_ttl=ACTIVITY_CACHE_TTL)
         return Activity.from_dict(response)
 
     def list(
@@ -64,49 +62,112 @@ class ActivitiesAPI:
             ...         page_token=result['nextPageToken']
             ...     )
         """
-        if not session_id.startswith("sessions/"):
-            session_id = f"sessions/{session_id}"
+        return self._list_normalized(_normalize_session(session_id), page_size, page_token)
 
+    def _list_normalized(
+        self,
+        session_name: str,
+        page_size: Optional[int] = None,
+        page_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """List activities for an already normalized ``sessions/{id}`` name."""
         params: Dict[str, Any] = {}
         if page_size is not None:
             params["pageSize"] = page_size
         if page_token:
             params["pageToken"] = page_token
 
-        path = f"{session_id}/activities"
-        response = self.client.get(path, params=params)
+        path = session_name + "/activities"
+        response = self.client.get(path, params=params, cache_ttl=LIST_CACHE_TTL)
 
         activities = []
         if response.get("activities"):
-            activities = [Activity.from_dict(a) for a in response["activities"]]
+            activities = list(map(Activity.from_dict, response["activities"]))
+
+            # Activities are immutable, so later get() calls for listed
+            # activities can be answered from the cache without a request. The
+            # cache keeps its own copy of each, apart from the returned models.
+            for activity_data in response["activities"]:
+                if activity_data.get("name"):
+                    self.client.cache.set(activity_data["name"], activity_data, ACTIVITY_CACHE_TTL)
 
         return {
             "activities": activities,
             "nextPageToken": response.get("nextPageToken"),
         }
 
-    def list_all(self, session_id: str) -> List[Activity]:
-        """List all activities for a session (handles pagination automatically).
+    def iter_pages(
+        self, session_id: str, page_size: Optional[int] = None
+    ) -> Iterator[List[Activity]]:
+        """Iterate over pages of activities for a session.
+
+        Each page is fetched only when the previous one has been consumed, so
+        callers can process activities without buffering the whole session.
 
         Args:
             session_id: The session ID or full name
+            page_size: Maximum number of activities per page
 
-        Returns:
-            List of all Activity objects
+        Yields:
+            Lists of Activity objects, one per page
 
         Example:
-            >>> all_activities = client.activities.list_all("session123")
-            >>> print(f"Total activities: {len(all_activities)}")
+            >>> for page in client.activities.iter_pages("session123"):
+            ...     for activity in page:
+            ...         print(activity.description)
         """
-        all_activities: List[Activity] = []
+        session_name = _normalize_session(session_id)
         page_token: Optional[str] = None
 
         while True:
-            result = self.list(session_id, page_token=page_token)
-            all_activities.extend(result["activities"])
+            result = self._list_normalized(session_name, page_size, page_token)
+            yield result["activities"]
 
             page_token = result.get("nextPageToken")
             if not page_token:
                 break
 
+    def iter(self, session_id: str, page_size: Optional[int] = None) -> Iterator[Activity]:
+        """Iterate over all activities of a session, fetching pages on demand.
+
+        Stopping early (e.g. with ``break``) skips the requests for any
+        remaining pages.
+
+        Args:
+            session_id: The session ID or full name
+            page_size: Maximum number of activities per page
+
+        Yields:
+            Activity objects in API order
+
+        Example:
+            >>> for i, activity in enumerate(client.activities.iter("session123")):
+            ...     print(activity.description)
+            ...     if i == 4:
+            ...         break
+        """
+        for page in self.iter_pages(session_id, page_size=page_size):
+            yield from page
+
+    def list_all(self, session_id: str) -> List[Activity]:
+        """List all activities for a session (handles pagination automatically).
+
+        Args:
+            session_id: The session ID or full name
+
+        Returns:
+            List of all Activity objects
+
+        Example:
+            >>> all_activities = client.activities.list_all("session123")
+            >>> print(f"Total activities: {len(all_activities)}")
+        """
+        pages = self.iter_pages(session_id)
+
+        # Reuse the first page's list as the accumulator; single-page sessions
+        # (the common case) are then returned without copying.
+        all_activities = next(pages)
+        for page in pages:
+            all_activities += page
+
         return all_activities
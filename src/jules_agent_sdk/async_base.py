@@ -1,7 +1,21 @@
 """Async base HTTP client for Jules API."""
 
-from typing import Optional, Dict, Any
+import asyncio
+import functools
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Optional, Dict, Any, AsyncIterator
 import aiohttp
+from jules_agent_sdk.base import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BACKOFF_FACTOR,
+    JSON_HEADERS,
+    _backoff_delay,
+    _parse_error_body,
+    _json_dumps,
+    _json_loads,
+)
+from jules_agent_sdk.cache import ResponseCache
+from jules_agent_sdk.ratelimit import TokenBucket, _parse_seconds
 from jules_agent_sdk.exceptions import (
     JulesAPIError,
     JulesAuthenticationError,
@@ -11,28 +25,119 @@ from jules_agent_sdk.exceptions import (
     JulesServerError,
 )
 
+# Default configuration constants
+DEFAULT_TIMEOUT = 30
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_CONNECTION_LIMIT = 128
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 64
+DEFAULT_DNS_CACHE_TTL = 300
+DEFAULT_KEEPALIVE_TIMEOUT = 75
+DEFAULT_MAX_CONCURRENCY = 64
+
+# Failures worth another attempt after a backoff
+_RETRYABLE_ERRORS = (
+    JulesRateLimitError,
+    JulesServerError,
+    aiohttp.ClientConnectionError,
+    asyncio.TimeoutError,
+)
+
+
+class _InFlight:
+    """A GET request shared by every caller awaiting the same URL."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Dict[str, Any]]") -> None:
+        self.task = task
+        self.waiters = 0
+
 
 class AsyncBaseClient:
     """Async HTTP client for making requests to Jules API."""
 
     BASE_URL = "https://jules.googleapis.com/v1alpha"
 
-    def __init__(self, api_key: str, base_url: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff_factor: float = DEFAULT_RETRY_BACKOFF_FACTOR,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_rps: Optional[float] = None,
+        connector_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connector_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ) -> None:
         """Initialize the async base client.
 
         Args:
             api_key: Jules API key for authentication
             base_url: Optional custom base URL (defaults to official API endpoint)
+            timeout: Total request timeout in seconds
+            max_retries: Maximum number of attempts per request
+            retry_backoff_factor: Backoff factor for retries (exponential)
+            max_concurrency: Maximum number of requests in flight at once
+            max_rps: Optional cap on requests started per second
+            connector_limit: Maximum number of open connections
+            connector_limit_per_host: Maximum number of open connections per host
+            dns_cache_ttl: Seconds to cache DNS lookups
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
         """
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1")
+
         self.api_key = api_key
         self.base_url = base_url or self.BASE_URL
+        # Prefix every request path is appended to, computed once
+        self._url_prefix = self.base_url.rstrip("/") + "/"
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff_factor = retry_backoff_factor
+        self.max_concurrency = max_concurrency
+        self.connector_limit = connector_limit
+        self.connector_limit_per_host = connector_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.rate_limiter = TokenBucket(rate=max_rps)
+        # Created on first request so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.cache = ResponseCache()
+        self._inflight: Dict[str, _InFlight] = {}
         self._session: Optional[aiohttp.ClientSession] = None
+        self._closed = False
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create the aiohttp session."""
-        if self._session is None or self._session.closed:
+        """Get or create the aiohttp session.
+
+        The session keeps a pooled connector so successive requests (e.g. pages
+        of a listing) reuse open TLS connections and cached DNS lookups. It is
+        created without awaiting anything, so concurrent first requests cannot
+        race each other into creating separate sessions.
+
+        Raises:
+            RuntimeError: If the client has been closed
+        """
+        if self._closed:
+            raise RuntimeError("Client is closed; create a new client to make further requests")
+
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.connector_limit,
+                limit_per_host=self.connector_limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+                enable_cleanup_closed=True,
+            )
+            # aiohttp sets Accept-Encoding itself (gzip/deflate, plus br once
+            # brotli is installed) and decompresses responses transparently
             self._session = aiohttp.ClientSession(
-                headers={"X-Goog-Api-Key": self.api_key}
+                headers={"X-Goog-Api-Key": self.api_key},
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout, connect=DEFAULT_CONNECT_TIMEOUT),
             )
         return self._session
 
@@ -50,12 +155,9 @@ class AsyncBaseClient:
             JulesServerError: For 5xx errors
             JulesAPIError: For other errors
         """
-        try:
-            error_data = await response.json()
-        except Exception:
-            error_data = {"error": await response.text()}
-
-        error_msg = error_data.get("error", {}).get("message", str(error_data))
+        error_data, error_msg = _parse_error_body(
+            response.status, response.headers.get("Content-Type", ""), await response.read()
+        )
 
         if response.status == 401:
             raise JulesAuthenticationError(error_msg, response.status, error_data)
@@ -64,7 +166,12 @@ class AsyncBaseClient:
         elif response.status == 400:
             raise JulesValidationError(error_msg, response.status, error_data)
         elif response.status == 429:
-            raise JulesRateLimitError(error_msg, response.status, error_data)
+            raise JulesRateLimitError(
+                error_msg,
+                response.status,
+                error_data,
+                retry_after_seconds=_parse_seconds(response.headers.get("Retry-After")),
+            )
         elif response.status >= 500:
             raise JulesServerError(error_msg, response.status, error_data)
         else:
@@ -77,7 +184,11 @@ class AsyncBaseClient:
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Make an async HTTP request to the Jules API.
+        """Make an async HTTP request to the Jules API with retries.
+
+        Network errors, timeouts, 429 and 5xx responses are retried with the
+        same exponential backoff as the sync client, waiting at least as long
+        as a ``Retry-After`` header asks.
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -88,36 +199,209 @@ class AsyncBaseClient:
         Returns:
             API response as dictionary
 
+        Raises:
+            JulesAPIError: On API error
+        """
+        # GETs for which an ETag is known are made conditional; a 304 is then
+        # answered with the response stored alongside that ETag
+        validator_key = self.cache.validator_key(path, params) if method == "GET" else None
+        validator = self.cache.get_validator(validator_key) if validator_key else None
+        headers = {"If-None-Match": validator[0]} if validator is not None else None
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                # Throttling waits happen before a concurrency slot is taken,
+                # so a Retry-After pause does not hold one while idle
+                await self.rate_limiter.acquire()
+                # The body is read before the concurrency slot is released
+                async with self._get_semaphore(), self._open(
+                    method, path, params=params, json=json, headers=headers
+                ) as response:
+                    if response.status == 304 and validator is not None:
+                        return validator[1]
+
+                    if response.status == 204:
+                        return {}
+
+                    # Chunked responses have no Content-Length, so emptiness is
+                    # judged from the body itself
+                    body = await response.read()
+                    if not body:
+                        return {}
+
+                    try:
+                        result: Dict[str, Any] = _json_loads(body)
+                    except ValueError as e:
+                        raise JulesAPIError(f"Invalid JSON response: {e}")
+
+                    if validator_key:
+                        etag = response.headers.get("ETag")
+                        if etag:
+                            self.cache.set_validator(validator_key, etag, result)
+                    return result
+
+            except _RETRYABLE_ERRORS as e:
+                await self._backoff(attempt, e)
+
+        # Only reachable with max_retries < 1
+        raise JulesAPIError("Request failed for unknown reason")
+
+    async def _backoff(self, attempt: int, error: Exception) -> None:
+        """Sleep before retrying a failed attempt, or raise once attempts run out."""
+        if attempt >= self.max_retries:
+            if isinstance(error, JulesAPIError):
+                raise error
+            raise JulesAPIError(f"Request failed after {attempt} attempts: {error}") from error
+        retry_after = getattr(error, "retry_after_seconds", None)
+        await asyncio.sleep(_backoff_delay(attempt, self.retry_backoff_factor, retry_after))
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore bounding requests in flight, creating it on first use."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    @asynccontextmanager
+    async def _stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Issue a request and yield the response before its body is read.
+
+        Error statuses are raised before the response is yielded, so callers
+        can consume the body incrementally from ``response.content``. Opening
+        the response is retried like ``_request``; failures while the caller
+        reads the body are not, since part of it has already been consumed.
+
+        The concurrency slot is released once the headers arrive rather than
+        held while the caller iterates, so requests made from inside the
+        ``async with`` body cannot deadlock against the stream.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path
+            params: Query parameters
+            json: JSON request body
+            headers: Extra request headers
+
+        Yields:
+            The open aiohttp response
+
+        Raises:
+            JulesAPIError: On API error
+        """
+        for attempt in range(1, self.max_retries + 1):
+            stack = AsyncExitStack()
+            try:
+                await self.rate_limiter.acquire()
+                async with self._get_semaphore():
+                    response = await stack.enter_async_context(
+                        self._open(method, path, params=params, json=json, headers=headers)
+                    )
+            except _RETRYABLE_ERRORS as e:
+                await self._backoff(attempt, e)
+                continue
+
+            async with stack:
+                yield response
+            return
+
+        # Only reachable with max_retries < 1
+        raise JulesAPIError("Request failed for unknown reason")
+
+    @asynccontextmanager
+    async def _open(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a single request and yield its response once headers arrive.
+
+        Callers take a rate-limit token and a concurrency slot first.
+
         Raises:
             JulesAPIError: On API error
         """
         session = await self._get_session()
-        url = f"{self.base_url}/{path.lstrip('/')}"
+        url = self._url_prefix + (path[1:] if path.startswith("/") else path)
+
+        body = _json_dumps(json) if json is not None else None
+        if body is not None:
+            headers = {**JSON_HEADERS, **headers} if headers else JSON_HEADERS
 
         async with session.request(
-            method=method, url=url, params=params, json=json
+            method=method, url=url, params=params, data=body, headers=headers
         ) as response:
+            self.rate_limiter.update_from_headers(response.headers)
+
             if not response.ok:
                 await self._handle_error(response)
 
-            if response.status == 204 or not response.content_length:
-                return {}
-
-            return await response.json()
+            yield response
 
     async def get(
-        self, path: str, params: Optional[Dict[str, Any]] = None
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Make an async GET request.
 
         Args:
             path: API endpoint path
             params: Query parameters
+            cache_ttl: If set, serve the response from (and store it in) the
+                response cache for this many seconds
 
         Returns:
             API response as dictionary
         """
-        return await self._request("GET", path, params=params)
+        key = self.cache.key(path, params)
+        if cache_ttl is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Identical GETs issued while one is in flight share its response. Each
+        # caller awaits it through a shield so cancelling one caller does not
+        # fail the others; the request itself is cancelled once no caller is
+        # left waiting for it.
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = _InFlight(asyncio.ensure_future(self._request("GET", path, params=params)))
+            self._inflight[key] = inflight
+            inflight.task.add_done_callback(functools.partial(self._inflight_done, key, inflight))
+
+        inflight.waiters += 1
+        try:
+            response = await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+            if not inflight.waiters and not inflight.task.done():
+                inflight.task.cancel()
+                self._inflight_done(key, inflight, inflight.task)
+
+        if cache_ttl is not None:
+            self.cache.set(key, response, cache_ttl)
+        return response
+
+    def _inflight_done(
+        self, key: str, inflight: _InFlight, task: "asyncio.Future[Dict[str, Any]]"
+    ) -> None:
+        """Forget a finished shared request and mark its exception as retrieved."""
+        if self._inflight.get(key) is inflight:
+            del self._inflight[key]
+        # Callers that were cancelled never see the result; without this asyncio
+        # would log the exception as never retrieved
+        if task.done() and not task.cancelled():
+            task.exception()
 
     async def post(
         self,
@@ -138,7 +422,8 @@ class AsyncBaseClient:
         return await self._request("POST", path, params=params, json=json)
 
     async def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session; the client cannot be used afterwards."""
+        self._closed = True
         if self._session and not self._session.closed:
             await self._session.close()
 
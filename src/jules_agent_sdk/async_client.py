@@ -1,15 +1,52 @@
 """Async Jules API client."""
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, ClassVar, FrozenSet, Iterable, Union
 import asyncio
-from jules_agent_sdk.async_base import AsyncBaseClient
+import random
+
+try:
+    import ijson  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional streaming support
+    ijson = None
+
+from jules_agent_sdk.async_base import (
+    AsyncBaseClient,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_MAX_CONCURRENCY,
+)
+from jules_agent_sdk.base import _normalize_session, _normalize_source
+from jules_agent_sdk.cache import (
+    ResponseCache,
+    SESSION_CACHE_TTL,
+    ACTIVITY_CACHE_TTL,
+    LIST_CACHE_TTL,
+)
 from jules_agent_sdk.models import Session, Activity, Source, SessionState
+from jules_agent_sdk.sessions import _create_session_payload
 from jules_agent_sdk.exceptions import JulesAPIError
 
+# Constants for session polling
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_MAX_POLL_INTERVAL = 10.0
+DEFAULT_POLL_MULTIPLIER = 2.0
+DEFAULT_POLL_JITTER = 0.1
+
+# Number of activity pages buffered ahead of the caller; kept small so callers
+# that stop early do not trigger many unneeded page requests
+DEFAULT_PREFETCH_PAGES = 2
+
+# Bytes read from the socket per parser step when streaming activity listings
+DEFAULT_STREAM_CHUNK_SIZE = 65536
+
 
 class AsyncSessionsAPI:
     """Async API client for managing Jules sessions."""
 
+    _TERMINAL_STATES: ClassVar[FrozenSet[SessionState]] = frozenset(
+        {SessionState.COMPLETED, SessionState.FAILED}
+    )
+
     def __init__(self, client: AsyncBaseClient) -> None:
         """Initialize the async Sessions API."""
         self.client = client
@@ -23,29 +60,29 @@ class AsyncSessionsAPI:
         require_plan_approval: bool = False,
     ) -> Session:
         """Create a new session asynchronously."""
-        data: Dict[str, Any] = {
-            "prompt": prompt,
-            "sourceContext": {"source": source},
-        }
-
-        if starting_branch:
-            data["sourceContext"]["githubRepoContext"] = {"startingBranch": starting_branch}
+        data = _create_session_payload(
+            prompt, source, starting_branch, title, require_plan_approval
+        )
+        response = await self.client.post("sessions", json=data)
+        self.client.cache.invalidate("sessions")
+        return Session.from_dict(response)
 
-        if title:
-            data["title"] = title
+    async def get(self, session_id: str, cache_ttl: Optional[float] = None) -> Session:
+        """Get a single session by ID, from the cache only if ``cache_ttl`` is set."""
+        if cache_ttl is None:
+            return await self._refresh(session_id)
 
-        if require_plan_approval:
-            data["requirePlanApproval"] = require_plan_approval
+        session_id = _normalize_session(session_id)
 
-        response = await self.client.post("sessions", json=data)
+        response = await self.client.get(session_id, cache_ttl=cache_ttl)
         return Session.from_dict(response)
 
-    async def get(self, session_id: str) -> Session:
-        """Get a single session by ID asynchronously."""
-        if not session_id.startswith("sessions/"):
-            session_id = f"sessions/{session_id}"
+    async def _refresh(self, session_id: str) -> Session:
+        """Fetch a session bypassing the cache, then store the fresh response."""
+        session_id = _normalize_session(session_id)
 
         response = await self.client.get(session_id)
+        self.client.cache.set(session_id, response, SESSION_CACHE_TTL)
         return Session.from_dict(response)
 
     async def list(
@@ -58,11 +95,11 @@ class AsyncSessionsAPI:
         if page_token:
             params["pageToken"] = page_token
 
-        response = await self.client.get("sessions", params=params)
+        response = await self.client.get("sessions", params=params, cache_ttl=LIST_CACHE_TTL)
 
         sessions = []
         if response.get("sessions"):
-            sessions = [Session.from_dict(s) for s in response["sessions"]]
+            sessions = list(map(Session.from_dict, response["sessions"]))
 
         return {
             "sessions": sessions,
@@ -71,40 +108,261 @@ class AsyncSessionsAPI:
 
     async def approve_plan(self, session_id: str) -> None:
         """Approve a plan in a session asynchronously."""
-        if not session_id.startswith("sessions/"):
-            session_id = f"sessions/{session_id}"
+        session_id = _normalize_session(session_id)
 
-        await self.client.post(f"{session_id}:approvePlan")
+        await self.client.post(session_id + ":approvePlan")
+        self._invalidate(session_id)
 
     async def send_message(self, session_id: str, prompt: str) -> None:
         """Send a message from the user to a session asynchronously."""
-        if not session_id.startswith("sessions/"):
-            session_id = f"sessions/{session_id}"
+        session_id = _normalize_session(session_id)
+
+        await self.client.post(session_id + ":sendMessage", json={"prompt": prompt})
+        self._invalidate(session_id)
 
-        await self.client.post(f"{session_id}:sendMessage", json={"prompt": prompt})
+    def _invalidate(self, session_name: str) -> None:
+        """Drop cached responses a write to a session may have made stale."""
+        cache = self.client.cache
+        cache.invalidate(session_name)
+        cache.invalidate(session_name + "/activities")
+        cache.invalidate("sessions")
 
     async def wait_for_completion(
-        self, session_id: str, poll_interval: int = 5, timeout: Optional[int] = None
+        self,
+        session_id: str,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: Optional[int] = None,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        multiplier: float = DEFAULT_POLL_MULTIPLIER,
+        jitter: float = DEFAULT_POLL_JITTER,
     ) -> Session:
-        """Poll a session asynchronously until it completes or fails."""
-        start_time = asyncio.get_event_loop().time()
-        terminal_states = {
-            SessionState.COMPLETED,
-            SessionState.FAILED,
-        }
+        """Poll a session asynchronously until it completes or fails.
+
+        The delay starts at ``poll_interval``, grows by ``multiplier`` (up to
+        ``max_poll_interval``) while the state is unchanged, and resets when the
+        state changes.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        name = _normalize_session(session_id)
+        delay = poll_interval
+        last_state: Optional[SessionState] = None
 
         while True:
-            session = await self.get(session_id)
+            session = await self._refresh(name)
 
-            if session.state in terminal_states:
+            if session.state in self._TERMINAL_STATES:
                 if session.state == SessionState.FAILED:
                     raise JulesAPIError(f"Session failed: {session_id}")
                 return session
 
-            if timeout and (asyncio.get_event_loop().time() - start_time) > timeout:
+            remaining = deadline - loop.time() if deadline is not None else None
+            if remaining is not None and remaining < 0:
                 raise TimeoutError(f"Session polling timed out after {timeout} seconds")
 
-            await asyncio.sleep(poll_interval)
+            if session.state == last_state:
+                delay = min(delay * multiplier, max_poll_interval)
+            else:
+                delay = poll_interval
+            last_state = session.state
+
+            # Never sleep past the deadline; the last poll happens right at it
+            pause = delay * random.uniform(1 - jitter, 1 + jitter)
+            await asyncio.sleep(pause if remaining is None else min(pause, remaining))
+
+    async def subscribe(
+        self,
+        session_id: str,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        jitter: float = DEFAULT_POLL_JITTER,
+    ) -> AsyncIterator[Session]:
+        """Yield the session asynchronously every time its state changes.
+
+        The API has no push channel for session updates, so this polls with the
+        same backoff as ``wait_for_completion`` and stops after a terminal state.
+        """
+        name = _normalize_session(session_id)
+        delay = poll_interval
+        last_state: Optional[SessionState] = None
+
+        while True:
+            session = await self._refresh(name)
+
+            if session.state != last_state:
+                last_state = session.state
+                delay = poll_interval
+                yield session
+            else:
+                delay = min(delay * 2, max_poll_interval)
+
+            if session.state in self._TERMINAL_STATES:
+                return
+
+            await asyncio.sleep(delay * random.uniform(1 - jitter, 1 + jitter))
+
+    def watch(
+        self,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        jitter: float = DEFAULT_POLL_JITTER,
+    ) -> "AsyncSessionWatcher":
+        """Create a watcher that polls many sessions from a single background task."""
+        return AsyncSessionWatcher(
+            self,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            jitter=jitter,
+        )
+
+    async def wait_for_all(
+        self,
+        session_ids: Iterable[str],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: Optional[int] = None,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        jitter: float = DEFAULT_POLL_JITTER,
+    ) -> List[Session]:
+        """Wait for several sessions to complete, polling them from one shared watcher."""
+        watcher = self.watch(
+            poll_interval=poll_interval, max_poll_interval=max_poll_interval, jitter=jitter
+        )
+        try:
+            return list(
+                await asyncio.wait_for(
+                    asyncio.gather(*(watcher.wait(i) for i in session_ids)), timeout
+                )
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Session polling timed out after {timeout} seconds")
+        finally:
+            await watcher.close()
+
+
+class _SessionWaiter:
+    """The future shared by every caller waiting on the same session."""
+
+    __slots__ = ("future", "callers")
+
+    def __init__(self, future: "asyncio.Future[Session]") -> None:
+        self.future = future
+        self.callers = 0
+
+
+class AsyncSessionWatcher:
+    """Track many sessions to completion with one shared polling loop.
+
+    Instead of every waiter polling its own session, one background task fetches
+    all pending sessions per tick (concurrently via ``asyncio.gather``) and
+    resolves each waiter's future once its session reaches a terminal state.
+
+    Example:
+        >>> watcher = client.sessions.watch()
+        >>> final = await watcher.wait(session.id)
+        >>> await watcher.close()
+    """
+
+    def __init__(
+        self,
+        sessions: AsyncSessionsAPI,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        jitter: float = DEFAULT_POLL_JITTER,
+    ) -> None:
+        """Initialize the watcher."""
+        self.sessions = sessions
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.jitter = jitter
+        self._waiters: Dict[str, _SessionWaiter] = {}
+        self._task: Optional["asyncio.Future[None]"] = None
+
+    async def wait(self, session_id: str) -> Session:
+        """Wait until a session completes; raises JulesAPIError if it fails.
+
+        Waits on a bare ID and on its full name share one poll; a session stops
+        being polled once every caller waiting on it has been cancelled.
+        """
+        name = _normalize_session(session_id)
+        waiter = self._waiters.get(name)
+        if waiter is None:
+            waiter = _SessionWaiter(asyncio.get_running_loop().create_future())
+            self._waiters[name] = waiter
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+        waiter.callers += 1
+        try:
+            return await asyncio.shield(waiter.future)
+        finally:
+            waiter.callers -= 1
+            if not waiter.callers and not waiter.future.done():
+                waiter.future.cancel()
+                del self._waiters[name]
+                if not self._waiters and self._task is not None:
+                    self._task.cancel()
+
+    async def _run(self) -> None:
+        """Poll all pending sessions until none are left."""
+        delay = self.poll_interval
+        last_states: Dict[str, SessionState] = {}
+
+        while self._waiters:
+            pending = list(self._waiters.items())
+            results = await asyncio.gather(
+                *(self.sessions._refresh(name) for name, _ in pending),
+                return_exceptions=True,
+            )
+
+            changed = False
+            for (name, waiter), result in zip(pending, results):
+                future = waiter.future
+                # Settled futures belong to waits that were all cancelled meanwhile
+                if future.done():
+                    continue
+
+                if isinstance(result, BaseException):
+                    del self._waiters[name]
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.cancel()
+                    continue
+
+                if last_states.get(name) != result.state:
+                    changed = True
+                last_states[name] = result.state
+
+                if result.state in self.sessions._TERMINAL_STATES:
+                    del self._waiters[name]
+                    if result.state == SessionState.FAILED:
+                        future.set_exception(JulesAPIError(f"Session failed: {name}"))
+                    else:
+                        future.set_result(result)
+
+            if not self._waiters:
+                break
+
+            if changed:
+                delay = self.poll_interval
+            else:
+                delay = min(delay * 2, self.max_poll_interval)
+
+            await asyncio.sleep(delay * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    async def close(self) -> None:
+        """Stop polling and cancel any pending waiters."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        for waiter in self._waiters.values():
+            waiter.future.cancel()
+        self._waiters.clear()
 
 
 class AsyncActivitiesAPI:
@@ -116,11 +374,8 @@ class AsyncActivitiesAPI:
 
     async def get(self, session_id: str, activity_id: str) -> Activity:
         """Get a single activity by ID asynchronously."""
-        if not session_id.startswith("sessions/"):
-            session_id = f"sessions/{session_id}"
-
-        path = f"{session_id}/activities/{activity_id}"
-        response = await self.client.get(path)
+        path = _normalize_session(session_id) + "/activities/" + activity_id
+        response = await self.client.get(path, cache_ttl=ACTIVITY_CACHE_TTL)
         return Activity.from_dict(response)
 
     async def list(
@@ -130,41 +385,180 @@ class AsyncActivitiesAPI:
         page_token: Optional[str] = None,
     ) -> Dict[str, Any]:
         """List activities for a session asynchronously."""
-        if not session_id.startswith("sessions/"):
-            session_id = f"sessions/{session_id}"
+        return await self._list_normalized(_normalize_session(session_id), page_size, page_token)
 
+    async def _list_normalized(
+        self,
+        session_name: str,
+        page_size: Optional[int] = None,
+        page_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """List activities for an already normalized ``sessions/{id}`` name."""
         params: Dict[str, Any] = {}
         if page_size is not None:
             params["pageSize"] = page_size
         if page_token:
             params["pageToken"] = page_token
 
-        path = f"{session_id}/activities"
-        response = await self.client.get(path, params=params)
+        path = session_name + "/activities"
+        response = await self.client.get(path, params=params, cache_ttl=LIST_CACHE_TTL)
 
         activities = []
         if response.get("activities"):
-            activities = [Activity.from_dict(a) for a in response["activities"]]
+            activities = list(map(Activity.from_dict, response["activities"]))
+
+            # Activities are immutable, so later get() calls for listed
+            # activities can be answered from the cache without a request. The
+            # cache keeps its own copy of each, apart from the returned models.
+            for activity_data in response["activities"]:
+                if activity_data.get("name"):
+                    self.client.cache.set(activity_data["name"], activity_data, ACTIVITY_CACHE_TTL)
 
         return {
             "activities": activities,
             "nextPageToken": response.get("nextPageToken"),
         }
 
-    async def list_all(self, session_id: str) -> List[Activity]:
-        """List all activities for a session asynchronously (handles pagination)."""
-        all_activities: List[Activity] = []
+    async def iter_pages(
+        self,
+        session_id: str,
+        page_size: Optional[int] = None,
+        prefetch: int = DEFAULT_PREFETCH_PAGES,
+    ) -> AsyncIterator[List[Activity]]:
+        """Yield pages of activities while the following pages are fetched.
+
+        Page tokens are chained, so requests are still issued one after another;
+        a background task keeps up to ``prefetch`` pages buffered so fetching the
+        next page overlaps with the caller's work on the current one.
+        """
+        queue: "asyncio.Queue[Union[List[Activity], Exception, None]]" = asyncio.Queue(
+            maxsize=max(prefetch, 1)
+        )
+
+        session_name = _normalize_session(session_id)
+
+        async def produce() -> None:
+            page_token: Optional[str] = None
+            try:
+                while True:
+                    result = await self._list_normalized(session_name, page_size, page_token)
+                    await queue.put(result["activities"])
+
+                    page_token = result.get("nextPageToken")
+                    if not page_token:
+                        break
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                page = await queue.get()
+                if page is None:
+                    return
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+        finally:
+            producer.cancel()
+
+    async def iter(
+        self,
+        session_id: str,
+        page_size: Optional[int] = None,
+        prefetch: int = DEFAULT_PREFETCH_PAGES,
+    ) -> AsyncIterator[Activity]:
+        """Yield every activity of a session while the next pages are prefetched.
+
+        Breaking out of the loop cancels the background page fetcher.
+        """
+        async for page in self.iter_pages(session_id, page_size=page_size, prefetch=prefetch):
+            for activity in page:
+                yield activity
+
+    async def stream_all(
+        self, session_id: str, page_size: Optional[int] = None
+    ) -> AsyncIterator[Activity]:
+        """Yield every activity of a session while each page is still downloading.
+
+        With the optional ``ijson`` package installed, each page is parsed
+        incrementally from the socket, so memory stays flat regardless of page
+        size and the first activity is available before the page has fully
+        arrived. Streamed activities are not added to the response cache.
+        Without ``ijson`` this behaves like :meth:`iter`.
+        """
+        if ijson is None:
+            async for activity in self.iter(session_id, page_size=page_size):
+                yield activity
+            return
+
+        path = _normalize_session(session_id) + "/activities"
         page_token: Optional[str] = None
 
         while True:
-            result = await self.list(session_id, page_token=page_token)
-            all_activities.extend(result["activities"])
+            params: Dict[str, Any] = {}
+            if page_size is not None:
+                params["pageSize"] = page_size
+            if page_token:
+                params["pageToken"] = page_token
+
+            page_token = None
+            async with self.client._stream("GET", path, params=params) as response:
+                builder = None
+                events = ijson.parse_async(
+                    response.content, buf_size=DEFAULT_STREAM_CHUNK_SIZE, use_float=True
+                )
+                async for prefix, event, value in events:
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == "activities.item" and event == "end_map":
+                            yield Activity.from_dict(builder.value)
+                            builder = None
+                    elif prefix == "activities.item" and event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix == "nextPageToken" and event == "string":
+                        page_token = value
 
-            page_token = result.get("nextPageToken")
             if not page_token:
                 break
 
-        return all_activities
+    async def list_all(
+        self, session_id: str, prefetch: int = DEFAULT_PREFETCH_PAGES
+    ) -> List[Activity]:
+        """List all activities for a session asynchronously (handles pagination)."""
+        all_activities: Optional[List[Activity]] = None
+
+        # Reuse the first page's list as the accumulator to avoid copying it
+        async for page in self.iter_pages(session_id, prefetch=prefetch):
+            if all_activities is None:
+                all_activities = page
+            else:
+                all_activities += page
+
+        return all_activities or []
+
+    async def list_all_many(self, session_ids: Iterable[str]) -> Dict[str, List[Activity]]:
+        """List all activities for several sessions concurrently.
+
+        Each session is paginated in its own task, so total latency follows the
+        longest session rather than the sum of all of them. If any task fails,
+        the remaining ones are cancelled before the error propagates.
+
+        Returns:
+            Mapping of each given session ID to its activities
+        """
+        session_ids = list(session_ids)
+        tasks = [asyncio.ensure_future(self.list_all(session_id)) for session_id in session_ids]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return dict(zip(session_ids, results))
 
 
 class AsyncSourcesAPI:
@@ -176,8 +570,7 @@ class AsyncSourcesAPI:
 
     async def get(self, source_id: str) -> Source:
         """Get a single source by ID asynchronously."""
-        if not source_id.startswith("sources/"):
-            source_id = f"sources/{source_id}"
+        source_id = _normalize_source(source_id)
 
         response = await self.client.get(source_id)
         return Source.from_dict(response)
@@ -189,37 +582,60 @@ class AsyncSourcesAPI:
         page_token: Optional[str] = None,
     ) -> Dict[str, Any]:
         """List sources asynchronously."""
-        params: Dict[str, Any] = {}
-        if filter_str:
-            params["filter"] = filter_str
-        if page_size is not None:
-            params["pageSize"] = page_size
-        if page_token:
-            params["pageToken"] = page_token
-
-        response = await self.client.get("sources", params=params)
+        response = await self._list_raw(filter_str, page_size, page_token)
 
         sources = []
         if response.get("sources"):
-            sources = [Source.from_dict(s) for s in response["sources"]]
+            sources = list(map(Source.from_dict, response["sources"]))
 
         return {
             "sources": sources,
             "nextPageToken": response.get("nextPageToken"),
         }
 
-    async def list_all(self, filter_str: Optional[str] = None) -> List[Source]:
-        """List all sources asynchronously (handles pagination)."""
-        all_sources: List[Source] = []
-        page_token: Optional[str] = None
+    async def _list_raw(
+        self,
+        filter_str: Optional[str] = None,
+        page_size: Optional[int] = None,
+        page_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Fetch one unparsed page of sources."""
+        params: Dict[str, Any] = {}
+        if filter_str:
+            params["filter"] = filter_str
+        if page_size is not None:
+            params["pageSize"] = page_size
+        if page_token:
+            params["pageToken"] = page_token
 
-        while True:
-            result = await self.list(filter_str=filter_str, page_token=page_token)
-            all_sources.extend(result["sources"])
+        return await self.client.get("sources", params=params, cache_ttl=LIST_CACHE_TTL)
 
-            page_token = result.get("nextPageToken")
-            if not page_token:
-                break
+    async def list_all(self, filter_str: Optional[str] = None) -> List[Source]:
+        """List all sources asynchronously (handles pagination).
+
+        The request for the next page is issued as soon as its token is known,
+        so it is in flight while the current page is being parsed.
+        """
+        all_sources: List[Source] = []
+        pending: Optional["asyncio.Future[Dict[str, Any]]"] = asyncio.ensure_future(
+            self._list_raw(filter_str)
+        )
+
+        try:
+            while pending is not None:
+                response = await pending
+
+                page_token = response.get("nextPageToken")
+                pending = (
+                    asyncio.ensure_future(self._list_raw(filter_str, page_token=page_token))
+                    if page_token
+                    else None
+                )
+
+                all_sources.extend(map(Source.from_dict, response.get("sources") or []))
+        finally:
+            if pending is not None:
+                pending.cancel()
 
         return all_sources
 
@@ -258,12 +674,30 @@ class AsyncJulesClient:
         sources: Async API client for source operations
     """
 
-    def __init__(self, api_key: str, base_url: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_backoff_factor: float = 1.0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_rps: Optional[float] = None,
+        connector_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connector_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    ) -> None:
         """Initialize the async Jules API client.
 
         Args:
             api_key: Your Jules API key for authentication
             base_url: Optional custom base URL
+            timeout: Request timeout in seconds (default: 30)
+            max_retries: Maximum number of retry attempts (default: 3)
+            retry_backoff_factor: Backoff factor for retries (default: 1.0)
+            max_concurrency: Maximum number of requests in flight at once (default: 64)
+            max_rps: Optional cap on requests started per second
+            connector_limit: Maximum number of open connections (default: 128)
+            connector_limit_per_host: Maximum number of open connections per host (default: 64)
 
         Raises:
             ValueError: If api_key is empty or None
@@ -271,13 +705,28 @@ class AsyncJulesClient:
         if not api_key:
             raise ValueError("API key is required")
 
-        self._base_client = AsyncBaseClient(api_key=api_key, base_url=base_url)
+        self._base_client = AsyncBaseClient(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_backoff_factor=retry_backoff_factor,
+            max_concurrency=max_concurrency,
+            max_rps=max_rps,
+            connector_limit=connector_limit,
+            connector_limit_per_host=connector_limit_per_host,
+        )
         self.sessions = AsyncSessionsAPI(self._base_client)
         self.activities = AsyncActivitiesAPI(self._base_client)
         self.sources = AsyncSourcesAPI(self._base_client)
 
+    @property
+    def cache(self) -> ResponseCache:
+        """Cache of GET responses; use ``cache.invalidate(path)`` to force a refetch."""
+        return self._base_client.cache
+
     async def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session; the client cannot be used afterwards."""
         await self._base_client.close()
 
     async def __aenter__(self) -> "AsyncJulesClient":
@@ -3,10 +3,18 @@
 import time
 import logging
 import json
-from typing import Optional, Dict, Any
+import functools
+from typing import Optional, Dict, Any, Tuple
 import requests
-from requests.exceptions import RequestException, Timeout, ConnectionError
+from requests.exceptions import Timeout, ConnectionError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+from jules_agent_sdk.cache import ResponseCache
+from jules_agent_sdk.ratelimit import _parse_seconds
 from jules_agent_sdk.exceptions import (
     JulesAPIError,
     JulesAuthenticationError,
@@ -24,6 +32,103 @@ DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_BACKOFF_FACTOR = 1.0
 DEFAULT_MAX_BACKOFF = 10.0
+DEFAULT_MAX_RETRY_AFTER = 60.0
+
+# Longest error body kept as the message when it is not a JSON error payload
+MAX_ERROR_TEXT = 4096
+
+# Failures worth retrying, checked once per failed attempt
+_RETRYABLE_EXCEPTIONS = (ConnectionError, Timeout, JulesServerError)
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed.
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode a JSON request body to bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+# Headers sent with requests that carry a pre-encoded JSON body
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _parse_error_body(status: int, content_type: str, raw: bytes) -> Tuple[Dict[str, Any], str]:
+    """Extract error data and message from an error response body.
+
+    Client errors (4xx) and responses declared as JSON carry the API's JSON
+    error payload. Other server errors (typically HTML pages from a proxy) are
+    not parsed; their text, truncated to ``MAX_ERROR_TEXT``, becomes the message.
+
+    Args:
+        status: HTTP status code
+        content_type: Value of the Content-Type header
+        raw: Raw response body
+
+    Returns:
+        Tuple of (error data, error message)
+    """
+    text = raw[:MAX_ERROR_TEXT].decode("utf-8", "replace")
+    if status < 500 or "json" in content_type:
+        try:
+            data = _json_loads(raw)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            error = data.get("error")
+            message = error.get("message") if isinstance(error, dict) else None
+            return data, message or text
+    return {"error": {"message": text}}, text
+
+
+def _backoff_delay(attempt: int, factor: float, retry_after: Optional[float] = None) -> float:
+    """Return the retry delay shared by the sync and async clients.
+
+    Args:
+        attempt: Current attempt number (1-indexed)
+        factor: Exponential backoff factor
+        retry_after: Delay requested by the server's Retry-After header, if any
+
+    Returns:
+        Backoff time in seconds
+    """
+    backoff = min(factor * (2.0 ** (attempt - 1)), DEFAULT_MAX_BACKOFF)
+    if retry_after:
+        backoff = max(backoff, min(retry_after, DEFAULT_MAX_RETRY_AFTER))
+    return backoff
+
+
+# Resource name prefixes
+SESSIONS_PREFIX = "sessions/"
+SOURCES_PREFIX = "sources/"
+
+
+def _qualify(resource_id: str, prefix: str) -> str:
+    """Return the full resource name (``{prefix}{id}``) for an ID or full name."""
+    return resource_id if resource_id.startswith(prefix) else prefix + resource_id
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_session(session_id: str) -> str:
+    """Return the full resource name (``sessions/{id}``) for a session ID or name."""
+    return _qualify(session_id, SESSIONS_PREFIX)
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_source(source_id: str) -> str:
+    """Return the full resource name (``sources/{id}``) for a source ID or name."""
+    return _qualify(source_id, SOURCES_PREFIX)
 
 
 class BaseClient:
@@ -58,6 +163,8 @@ class BaseClient:
         """
         self.api_key = api_key
         self.base_url = base_url or self.BASE_URL
+        # Prefix every request path is appended to, computed once
+        self._url_prefix = self.base_url.rstrip("/") + "/"
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_backoff_factor = retry_backoff_factor
@@ -66,7 +173,12 @@ class BaseClient:
         self.request_count = 0
         self.error_count = 0
 
-        # Create session with connection pooling
+        # Cache for GET responses of single resources
+        self.cache = ResponseCache()
+
+        # Create session with connection pooling. The session's default
+        # Accept-Encoding already advertises every coding urllib3 can decode
+        # (gzip/deflate, plus br once brotli is installed), so it is kept as is.
         self.session = requests.Session()
         self.session.headers.update({
             "X-Goog-Api-Key": self.api_key,
@@ -82,7 +194,7 @@ class BaseClient:
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
-        logger.info(f"Initialized Jules API client (base_url={self.base_url})")
+        logger.info("Initialized Jules API client (base_url=%s)", self.base_url)
 
     def _should_retry(self, exception: Exception, attempt: int) -> bool:
         """Determine if request should be retried.
@@ -94,36 +206,21 @@ class BaseClient:
         Returns:
             True if should retry, False otherwise
         """
-        if attempt >= self.max_retries:
-            return False
-
-        # Retry on network errors
-        if isinstance(exception, (ConnectionError, Timeout)):
-            logger.warning(f"Network error on attempt {attempt}, will retry: {exception}")
-            return True
-
-        # Retry on 5xx errors
-        if isinstance(exception, JulesServerError):
-            logger.warning(f"Server error on attempt {attempt}, will retry: {exception}")
-            return True
-
-        # Don't retry on client errors (4xx)
-        return False
+        # Network errors and 5xx are retried; client errors (4xx) are not
+        return attempt < self.max_retries and isinstance(exception, _RETRYABLE_EXCEPTIONS)
 
-    def _calculate_backoff(self, attempt: int) -> float:
+    def _calculate_backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
         """Calculate backoff time for retry.
 
         Args:
             attempt: Current attempt number (1-indexed)
+            retry_after: Delay requested by the server's Retry-After header, if any
 
         Returns:
             Backoff time in seconds
         """
-        backoff = min(
-            self.retry_backoff_factor * (2 ** (attempt - 1)),
-            DEFAULT_MAX_BACKOFF,
-        )
-        logger.debug(f"Backoff for attempt {attempt}: {backoff}s")
+        backoff = _backoff_delay(attempt, self.retry_backoff_factor, retry_after)
+        logger.debug("Backoff for attempt %d: %ss", attempt, backoff)
         return backoff
 
     def _handle_rate_limit(self, response: requests.Response) -> None:
@@ -136,20 +233,21 @@ class BaseClient:
             JulesRateLimitError: With retry information
         """
         retry_after = response.headers.get("Retry-After")
+        retry_after_seconds = _parse_seconds(retry_after)
         retry_info = {}
 
         if retry_after:
-            try:
-                retry_info["retry_after_seconds"] = int(retry_after)
-                logger.warning(f"Rate limited. Retry after {retry_after} seconds")
-            except ValueError:
-                logger.warning(f"Rate limited. Invalid Retry-After header: {retry_after}")
+            if retry_after_seconds is not None:
+                retry_info["retry_after_seconds"] = retry_after_seconds
+                logger.warning("Rate limited. Retry after %g seconds", retry_after_seconds)
+            else:
+                logger.warning("Rate limited. Invalid Retry-After header: %s", retry_after)
 
         error_msg = "Rate limit exceeded"
-        if retry_info.get("retry_after_seconds"):
-            error_msg += f". Retry after {retry_info['retry_after_seconds']} seconds"
+        if retry_after_seconds:
+            error_msg += f". Retry after {retry_after_seconds:g} seconds"
 
-        raise JulesRateLimitError(error_msg, 429, retry_info)
+        raise JulesRateLimitError(error_msg, 429, retry_info, retry_after_seconds)
 
     def _handle_error(self, response: requests.Response) -> None:
         """Handle HTTP error responses.
@@ -171,17 +269,15 @@ class BaseClient:
             return
 
         # Parse error response
-        try:
-            error_data = response.json()
-        except (ValueError, json.JSONDecodeError) as e:
-            logger.debug(f"Failed to parse error response as JSON: {e}")
-            error_data = {"error": {"message": response.text}}
-
-        error_msg = error_data.get("error", {}).get("message", response.text)
+        error_data, error_msg = _parse_error_body(
+            response.status_code, response.headers.get("Content-Type", ""), response.content
+        )
 
         # Log error
         logger.error(
-            f"API error: {response.status_code} - {error_msg}",
+            "API error: %s - %s",
+            response.status_code,
+            error_msg,
             extra={
                 "status_code": response.status_code,
                 "url": response.url,
@@ -224,10 +320,23 @@ class BaseClient:
             Timeout: On timeout
             ConnectionError: On connection error
         """
-        url = f"{self.base_url}/{path.lstrip('/')}"
+        url = self._url_prefix + (path[1:] if path.startswith("/") else path)
         self.request_count += 1
 
-        logger.debug(f"Request: {method} {path}", extra={"params": params, "json": json})
+        # Encode the body once up front instead of letting requests do it per attempt
+        body = _json_dumps(json) if json is not None else None
+        headers = JSON_HEADERS if body is not None else None
+
+        # GETs for which an ETag is known are made conditional; a 304 is then
+        # answered with the response stored alongside that ETag
+        validator_key = self.cache.validator_key(path, params) if method == "GET" else None
+        validator = self.cache.get_validator(validator_key) if validator_key else None
+        if validator is not None:
+            headers = {"If-None-Match": validator[0]}
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Request: %s %s", method, path, extra={"params": params, "json": json})
 
         last_exception: Optional[Exception] = None
 
@@ -238,14 +347,30 @@ class BaseClient:
                     method=method,
                     url=url,
                     params=params,
-                    json=json,
+                    data=body,
+                    headers=headers,
                     timeout=self.timeout,
                 )
 
-                logger.debug(
-                    f"Response: {response.status_code}",
-                    extra={"attempt": attempt, "status": response.status_code},
-                )
+                if debug:
+                    logger.debug(
+                        "Response: %s",
+                        response.status_code,
+                        extra={"attempt": attempt, "status": response.status_code},
+                    )
+
+                # Retryable statuses are retried straight away, without
+                # building, logging and catching an exception first
+                if response.status_code in _RETRYABLE_STATUS and attempt < self.max_retries:
+                    self.error_count += 1
+                    logger.warning(
+                        "Retryable status %s on attempt %d, will retry",
+                        response.status_code,
+                        attempt,
+                    )
+                    retry_after = _parse_seconds(response.headers.get("Retry-After"))
+                    time.sleep(self._calculate_backoff(attempt, retry_after))
+                    continue
 
                 # Handle errors
                 if not response.ok:
@@ -259,20 +384,33 @@ class BaseClient:
                             continue
                         raise
 
-                # Handle empty responses
-                if response.status_code == 204 or not response.content:
+                if response.status_code == 304 and validator is not None:
+                    return validator[1]
+
+                # Handle empty responses, judged from the body so chunked
+                # responses without Content-Length are parsed too
+                if response.status_code == 204:
+                    return {}
+                content = response.content
+                if not content:
                     return {}
 
                 # Parse and return JSON
                 try:
-                    return response.json()
-                except (ValueError, json.JSONDecodeError) as e:
-                    logger.error(f"Failed to parse response as JSON: {e}")
+                    result: Dict[str, Any] = _json_loads(content)
+                except ValueError as e:
+                    logger.error("Failed to parse response as JSON: %s", e)
                     raise JulesAPIError(f"Invalid JSON response: {e}")
 
+                if validator_key:
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        self.cache.set_validator(validator_key, etag, result)
+                return result
+
             except (ConnectionError, Timeout) as e:
                 self.error_count += 1
-                logger.warning(f"Request failed (attempt {attempt}/{self.max_retries}): {e}")
+                logger.warning("Request failed (attempt %d/%d): %s", attempt, self.max_retries, e)
 
                 if self._should_retry(e, attempt):
                     last_exception = e
@@ -290,17 +428,34 @@ class BaseClient:
         # Shouldn't reach here, but just in case
         raise JulesAPIError("Request failed for unknown reason")
 
-    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """Make a GET request.
 
         Args:
             path: API endpoint path
             params: Query parameters
+            cache_ttl: If set, serve the response from (and store it in) the
+                response cache for this many seconds
 
         Returns:
             API response as dictionary
         """
-        return self._request("GET", path, params=params)
+        if cache_ttl is None:
+            return self._request("GET", path, params=params)
+
+        key = self.cache.key(path, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self._request("GET", path, params=params)
+        self.cache.set(key, response, cache_ttl)
+        return response
 
     def post(
         self,
@@ -334,7 +489,7 @@ class BaseClient:
     def close(self) -> None:
         """Close the HTTP session."""
         logger.info(
-            f"Closing client. Stats: {self.request_count} requests, {self.error_count} errors"
+            "Closing client. Stats: %d requests, %d errors", self.request_count, self.error_count
         )
         self.session.close()
 
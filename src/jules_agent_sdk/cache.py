@@ -0,0 +1,151 @@
+"""In-process cache for GET responses."""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlencode
+
+# Default configuration constants
+DEFAULT_CACHE_SIZE = 1024
+SESSION_CACHE_TTL = 1.0
+LIST_CACHE_TTL = 0.5
+ACTIVITY_CACHE_TTL = float("inf")
+
+
+def _copy(value: Any) -> Any:
+    """Copy a parsed JSON value; dicts and lists are its only mutable parts."""
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+class ResponseCache:
+    """Small LRU cache of parsed API responses keyed by request path.
+
+    Entries expire after a per-entry TTL, so short TTLs collapse tight polling
+    loops into at most one request per TTL window while infinite TTLs suit
+    resources that never change once created, such as activities. Entries that
+    never expire are kept in an LRU of their own, so paging through a long
+    activity history cannot evict short-lived entries such as sessions.
+
+    Separately, the last response of a single-resource GET that carried an
+    ``ETag`` is kept as a validator, so later requests can be made conditional
+    and a ``304 Not Modified`` answered from memory.
+
+    Responses are copied on the way in and out, so callers (and the models
+    built from their results) can modify what they are handed without
+    changing what later callers see.
+
+    Example:
+        >>> client.cache.invalidate("sessions/abc123")
+        >>> client.cache.clear()
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest,
+                applied separately to expiring and never-expiring entries
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._permanent: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._validators: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a request path and its query parameters."""
+        if not params:
+            return path
+        return f"{path}?{urlencode(sorted(params.items()))}"
+
+    @staticmethod
+    def validator_key(path: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Return the key to keep an ETag validator under, or None to keep none.
+
+        Only single resources (``collection/id`` paths without query parameters)
+        are revalidated; list pages change with every write and would each pin
+        a full copy of the page in memory.
+        """
+        if params or path.strip("/").count("/") % 2 == 0:
+            return None
+        return path
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for a key, or None if missing or expired."""
+        with self._lock:
+            entries = self._entries
+            entry = entries.get(key)
+            if entry is None:
+                entries = self._permanent
+                entry = entries.get(key)
+                if entry is None:
+                    self.misses += 1
+                    return None
+
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del entries[key]
+                self.misses += 1
+                return None
+
+            entries.move_to_end(key)
+            self.hits += 1
+        copied: Dict[str, Any] = _copy(response)
+        return copied
+
+    def set(self, key: str, response: Dict[str, Any], ttl: float) -> None:
+        """Store a response under a key for ``ttl`` seconds."""
+        entries = self._permanent if math.isinf(ttl) else self._entries
+        response = _copy(response)
+        with self._lock:
+            entries[key] = (time.monotonic() + ttl, response)
+            entries.move_to_end(key)
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+    def get_validator(self, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Return the ``(etag, response)`` last seen for a key, if any."""
+        with self._lock:
+            entry = self._validators.get(key)
+            if entry is None:
+                return None
+            self._validators.move_to_end(key)
+        return entry[0], _copy(entry[1])
+
+    def set_validator(self, key: str, etag: str, response: Dict[str, Any]) -> None:
+        """Remember a response together with the ETag it was served with."""
+        response = _copy(response)
+        with self._lock:
+            self._validators[key] = (etag, response)
+            self._validators.move_to_end(key)
+            while len(self._validators) > self.maxsize:
+                self._validators.popitem(last=False)
+
+    def invalidate(self, path: str) -> None:
+        """Drop cached responses and validators for a path and its query variants."""
+        prefix = f"{path}?"
+        with self._lock:
+            for entries in (self._entries, self._permanent, self._validators):
+                entries.pop(path, None)
+                for key in [k for k in entries if k.startswith(prefix)]:
+                    del entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._permanent.clear()
+            self._validators.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries) + len(self._permanent)
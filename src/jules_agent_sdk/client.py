@@ -2,6 +2,7 @@
 
 from typing import Optional
 from jules_agent_sdk.base import BaseClient
+from jules_agent_sdk.cache import ResponseCache
 from jules_agent_sdk.sessions import SessionsAPI
 from jules_agent_sdk.activities import ActivitiesAPI
 from jules_agent_sdk.sources import SourcesAPI
@@ -79,6 +80,15 @@ class JulesClient:
         self.activities = ActivitiesAPI(self._base_client)
         self.sources = SourcesAPI(self._base_client)
 
+    @property
+    def cache(self) -> ResponseCache:
+        """Cache of GET responses.
+
+        Example:
+            >>> client.cache.invalidate("sessions/abc123")
+        """
+        return self._base_client.cache
+
     def close(self) -> None:
         """Close the HTTP session.
 
@@ -1,7 +1,6 @@
 """Configuration management for Jules Agent SDK."""
 
 from dataclasses import dataclass
-from typing import Optional
 
 
 @dataclass
@@ -1,11 +1,14 @@
 """Custom exceptions for the Jules Agent SDK."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 
 class JulesAPIError(Exception):
     """Base exception for all Jules API errors."""
 
+    # Slots keep retry loops from allocating an attribute dict per raised error
+    __slots__ = ("message", "status_code", "response")
+
     def __init__(
         self,
         message: str,
@@ -24,32 +27,59 @@ class JulesAPIError(Exception):
         self.status_code = status_code
         self.response = response
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle slotted attributes too; ``BaseException`` only saves ``__dict__``."""
+        state = dict(self.__dict__)
+        for klass in type(self).__mro__:
+            for name in klass.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return type(self), self.args, state
+
 
 class JulesAuthenticationError(JulesAPIError):
     """Raised when authentication fails (401)."""
 
-    pass
+    __slots__ = ()
 
 
 class JulesNotFoundError(JulesAPIError):
     """Raised when a resource is not found (404)."""
 
-    pass
+    __slots__ = ()
 
 
 class JulesValidationError(JulesAPIError):
     """Raised when request validation fails (400)."""
 
-    pass
+    __slots__ = ()
 
 
 class JulesRateLimitError(JulesAPIError):
     """Raised when rate limit is exceeded (429)."""
 
-    pass
+    __slots__ = ("retry_after_seconds",)
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        response: Optional[Dict[str, Any]] = None,
+        retry_after_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the exception.
+
+        Args:
+            message: Error message
+            status_code: HTTP status code
+            response: API response data
+            retry_after_seconds: Delay requested by the server's Retry-After header
+        """
+        super().__init__(message, status_code, response)
+        self.retry_after_seconds = retry_after_seconds
 
 
 class JulesServerError(JulesAPIError):
     """Raised when server returns 5xx error."""
 
-    pass
+    __slots__ = ()
@@ -1,9 +1,40 @@
 """Data models for Jules API resources."""
 
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field, fields
+from sys import intern
+from typing import Optional, List, Dict, Any, Callable, Tuple, Type, TypeVar
 from enum import Enum
 
+_T = TypeVar("_T")
+
+
+def _slotted(cls: Type[_T]) -> Type[_T]:
+    """Rebuild a dataclass with ``__slots__`` for its fields.
+
+    Equivalent to ``@dataclass(slots=True)``, which is only available on Python 3.10+.
+    Slotted instances skip the per-instance ``__dict__``, which keeps large pages of
+    parsed records smaller and faster to construct.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    metaclass: Any = type(cls)
+    slotted: Type[_T] = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+# The from_dict constructors below pass arguments positionally, in field order:
+# matching keyword arguments costs about as much as parsing the fields of these
+# small classes. Keep argument order in sync when adding or reordering fields.
+# Session keeps keywords: it has too many interchangeable string fields for a
+# misordered argument to be caught.
+
 
 class SessionState(str, Enum):
     """Session state enumeration."""
@@ -19,6 +50,12 @@ class SessionState(str, Enum):
     COMPLETED = "COMPLETED"
 
 
+# API value -> SessionState, so parsing skips Enum call dispatch and the
+# ValueError path for unknown states
+_SESSION_STATES: Dict[Any, SessionState] = {state.value: state for state in SessionState}
+
+
+@_slotted
 @dataclass
 class GitHubBranch:
     """A GitHub branch."""
@@ -28,13 +65,14 @@ class GitHubBranch:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "GitHubBranch":
         """Create from API response dictionary."""
-        return cls(display_name=data.get("displayName", ""))
+        return cls(data.get("displayName", ""))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dictionary."""
         return {"displayName": self.display_name}
 
 
+@_slotted
 @dataclass
 class GitHubRepo:
     """A GitHub repository."""
@@ -48,20 +86,16 @@ class GitHubRepo:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "GitHubRepo":
         """Create from API response dictionary."""
-        default_branch = None
-        if data.get("defaultBranch"):
-            default_branch = GitHubBranch.from_dict(data["defaultBranch"])
-
-        branches = []
-        if data.get("branches"):
-            branches = [GitHubBranch.from_dict(b) for b in data["branches"]]
+        get = data.get
+        default_branch = get("defaultBranch")
+        branches = get("branches")
 
         return cls(
-            owner=data.get("owner", ""),
-            repo=data.get("repo", ""),
-            is_private=data.get("isPrivate", False),
-            default_branch=default_branch,
-            branches=branches,
+            get("owner", ""),
+            get("repo", ""),
+            get("isPrivate", False),
+            GitHubBranch.from_dict(default_branch) if default_branch else None,
+            [GitHubBranch.from_dict(b) for b in branches] if branches else [],
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -78,6 +112,7 @@ class GitHubRepo:
         return result
 
 
+@_slotted
 @dataclass
 class Source:
     """An input source of data for a session."""
@@ -89,14 +124,13 @@ class Source:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Source":
         """Create from API response dictionary."""
-        github_repo = None
-        if data.get("githubRepo"):
-            github_repo = GitHubRepo.from_dict(data["githubRepo"])
+        get = data.get
+        github_repo = get("githubRepo")
 
         return cls(
-            name=data.get("name", ""),
-            id=data.get("id", ""),
-            github_repo=github_repo,
+            get("name", ""),
+            get("id", ""),
+            GitHubRepo.from_dict(github_repo) if github_repo else None,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -106,7 +140,12 @@ class Source:
             result["githubRepo"] = self.github_repo.to_dict()
         return result
 
+    def __hash__(self) -> int:
+        """Hash by ID; equality still compares every field."""
+        return hash(self.id)
 
+
+@_slotted
 @dataclass
 class GitHubRepoContext:
     """Context to use a GitHubRepo in a session."""
@@ -116,13 +155,14 @@ class GitHubRepoContext:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "GitHubRepoContext":
         """Create from API response dictionary."""
-        return cls(starting_branch=data.get("startingBranch", ""))
+        return cls(data.get("startingBranch", ""))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dictionary."""
         return {"startingBranch": self.starting_branch}
 
 
+@_slotted
 @dataclass
 class SourceContext:
     """Context for how to use a source in a session."""
@@ -137,7 +177,7 @@ class SourceContext:
         if data.get("githubRepoContext"):
             github_context = GitHubRepoContext.from_dict(data["githubRepoContext"])
 
-        return cls(source=data.get("source", ""), github_repo_context=github_context)
+        return cls(data.get("source", ""), github_context)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dictionary."""
@@ -147,6 +187,7 @@ class SourceContext:
         return result
 
 
+@_slotted
 @dataclass
 class PullRequest:
     """A pull request."""
@@ -158,17 +199,15 @@ class PullRequest:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PullRequest":
         """Create from API response dictionary."""
-        return cls(
-            url=data.get("url", ""),
-            title=data.get("title", ""),
-            description=data.get("description", ""),
-        )
+        get = data.get
+        return cls(get("url", ""), get("title", ""), get("description", ""))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dictionary."""
         return {"url": self.url, "title": self.title, "description": self.description}
 
 
+@_slotted
 @dataclass
 class SessionOutput:
     """An output of a session."""
@@ -181,7 +220,7 @@ class SessionOutput:
         pr = None
         if data.get("pullRequest"):
             pr = PullRequest.from_dict(data["pullRequest"])
-        return cls(pull_request=pr)
+        return cls(pr)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dictionary."""
@@ -191,6 +230,7 @@ class SessionOutput:
         return result
 
 
+@_slotted
 @dataclass
 class Session:
     """A session is a contiguous amount of work within the same context."""
@@ -210,30 +250,21 @@ class Session:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Session":
         """Create from API response dictionary."""
-        source_context = SourceContext.from_dict(data.get("sourceContext", {}))
-        outputs = []
-        if data.get("outputs"):
-            outputs = [SessionOutput.from_dict(o) for o in data["outputs"]]
-
-        state = SessionState.STATE_UNSPECIFIED
-        if data.get("state"):
-            try:
-                state = SessionState(data["state"])
-            except ValueError:
-                state = SessionState.STATE_UNSPECIFIED
+        get = data.get
+        outputs = get("outputs")
 
         return cls(
-            name=data.get("name", ""),
-            id=data.get("id", ""),
-            prompt=data.get("prompt", ""),
-            source_context=source_context,
-            title=data.get("title", ""),
-            require_plan_approval=data.get("requirePlanApproval", False),
-            create_time=data.get("createTime", ""),
-            update_time=data.get("updateTime", ""),
-            state=state,
-            url=data.get("url", ""),
-            outputs=outputs,
+            prompt=get("prompt", ""),
+            source_context=SourceContext.from_dict(get("sourceContext", {})),
+            name=get("name", ""),
+            id=get("id", ""),
+            title=get("title", ""),
+            require_plan_approval=get("requirePlanApproval", False),
+            create_time=get("createTime", ""),
+            update_time=get("updateTime", ""),
+            state=_SESSION_STATES.get(get("state"), SessionState.STATE_UNSPECIFIED),
+            url=get("url", ""),
+            outputs=[SessionOutput.from_dict(o) for o in outputs] if outputs else [],
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -252,7 +283,17 @@ class Session:
             result["outputs"] = [o.to_dict() for o in self.outputs]
         return result
 
+    def __hash__(self) -> int:
+        """Hash by ID so sessions can be used in sets and as dict keys.
+
+        Equality still compares every field, so two snapshots of one session in
+        different states stay distinct; key a dict by ``session.id`` to keep
+        only the latest snapshot of each session.
+        """
+        return hash(self.id)
+
 
+@_slotted
 @dataclass
 class PlanStep:
     """A step in a plan."""
@@ -265,12 +306,8 @@ class PlanStep:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PlanStep":
         """Create from API response dictionary."""
-        return cls(
-            id=data.get("id", ""),
-            title=data.get("title", ""),
-            description=data.get("description", ""),
-            index=data.get("index", 0),
-        )
+        get = data.get
+        return cls(get("id", ""), get("title", ""), get("description", ""), get("index", 0))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dictionary."""
@@ -282,6 +319,7 @@ class PlanStep:
         }
 
 
+@_slotted
 @dataclass
 class Plan:
     """A sequence of steps that the agent will take to complete the task."""
@@ -293,12 +331,13 @@ class Plan:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Plan":
         """Create from API response dictionary."""
-        steps = []
-        if data.get("steps"):
-            steps = [PlanStep.from_dict(s) for s in data["steps"]]
+        get = data.get
+        steps = get("steps")
 
         return cls(
-            id=data.get("id", ""), steps=steps, create_time=data.get("createTime", "")
+            get("id", ""),
+            [PlanStep.from_dict(s) for s in steps] if steps else [],
+            get("createTime", ""),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -310,6 +349,7 @@ class Plan:
         }
 
 
+@_slotted
 @dataclass
 class GitPatch:
     """A patch in Git format."""
@@ -321,10 +361,11 @@ class GitPatch:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "GitPatch":
         """Create from API response dictionary."""
+        get = data.get
         return cls(
-            unidiff_patch=data.get("unidiffPatch", ""),
-            base_commit_id=data.get("baseCommitId", ""),
-            suggested_commit_message=data.get("suggestedCommitMessage", ""),
+            get("unidiffPatch", ""),
+            get("baseCommitId", ""),
+            get("suggestedCommitMessage", ""),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -336,6 +377,7 @@ class GitPatch:
         }
 
 
+@_slotted
 @dataclass
 class ChangeSet:
     """A change set artifact."""
@@ -349,7 +391,7 @@ class ChangeSet:
         git_patch = None
         if data.get("gitPatch"):
             git_patch = GitPatch.from_dict(data["gitPatch"])
-        return cls(source=data.get("source", ""), git_patch=git_patch)
+        return cls(data.get("source", ""), git_patch)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dictionary."""
@@ -359,6 +401,7 @@ class ChangeSet:
         return result
 
 
+@_slotted
 @dataclass
 class Media:
     """A media artifact."""
@@ -369,13 +412,14 @@ class Media:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Media":
         """Create from API response dictionary."""
-        return cls(data=data.get("data", ""), mime_type=data.get("mimeType", ""))
+        return cls(data.get("data", ""), data.get("mimeType", ""))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dictionary."""
         return {"data": self.data, "mimeType": self.mime_type}
 
 
+@_slotted
 @dataclass
 class BashOutput:
     """A bash output artifact."""
@@ -387,17 +431,15 @@ class BashOutput:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BashOutput":
         """Create from API response dictionary."""
-        return cls(
-            command=data.get("command", ""),
-            output=data.get("output", ""),
-            exit_code=data.get("exitCode", 0),
-        )
+        get = data.get
+        return cls(get("command", ""), get("output", ""), get("exitCode", 0))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dictionary."""
         return {"command": self.command, "output": self.output, "exitCode": self.exit_code}
 
 
+@_slotted
 @dataclass
 class Artifact:
     """An artifact is a single unit of data produced by an activity step."""
@@ -408,19 +450,18 @@ class Artifact:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Artifact":
-        """Create from API response dictionary."""
-        change_set = None
-        media = None
-        bash_output = None
+        """Create from API response dictionary.
 
-        if data.get("changeSet"):
-            change_set = ChangeSet.from_dict(data["changeSet"])
-        if data.get("media"):
-            media = Media.from_dict(data["media"])
-        if data.get("bashOutput"):
-            bash_output = BashOutput.from_dict(data["bashOutput"])
+        An artifact carries exactly one of its payload keys, so this walks the
+        keys that are present once instead of probing each one.
+        """
+        kwargs = {}
+        for key, value in data.items():
+            parser = _ARTIFACT_PARSERS.get(key)
+            if parser is not None and value:
+                kwargs[parser[0]] = parser[1](value)
 
-        return cls(change_set=change_set, media=media, bash_output=bash_output)
+        return cls(**kwargs)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dictionary."""
@@ -434,6 +475,15 @@ class Artifact:
         return result
 
 
+# API key -> (attribute name, parser) for the payload an Artifact carries
+_ARTIFACT_PARSERS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Any]]] = {
+    "changeSet": ("change_set", ChangeSet.from_dict),
+    "media": ("media", Media.from_dict),
+    "bashOutput": ("bash_output", BashOutput.from_dict),
+}
+
+
+@_slotted
 @dataclass
 class Activity:
     """An Activity is a single unit of work within a session."""
@@ -454,26 +504,26 @@ class Activity:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Activity":
-        """Create from API response dictionary."""
-        artifacts = []
-        if data.get("artifacts"):
-            artifacts = [Artifact.from_dict(a) for a in data["artifacts"]]
+        """Create from API response dictionary.
 
-        return cls(
-            name=data.get("name", ""),
-            id=data.get("id", ""),
-            description=data.get("description", ""),
-            create_time=data.get("createTime", ""),
-            originator=data.get("originator", ""),
-            artifacts=artifacts,
-            agent_messaged=data.get("agentMessaged"),
-            user_messaged=data.get("userMessaged"),
-            plan_generated=data.get("planGenerated"),
-            plan_approved=data.get("planApproved"),
-            progress_updated=data.get("progressUpdated"),
-            session_completed=data.get("sessionCompleted"),
-            session_failed=data.get("sessionFailed"),
-        )
+        Activities carry only a handful of the possible keys, so this walks the
+        keys that are present once instead of looking up every field.
+        """
+        kwargs = dict(_ACTIVITY_DEFAULTS)
+        for key, value in data.items():
+            attr = _ACTIVITY_FIELDS.get(key)
+            if attr is not None:
+                kwargs[attr] = value
+
+        # Only a couple of originators exist; share one string across a listing
+        originator = kwargs["originator"]
+        if isinstance(originator, str):
+            kwargs["originator"] = intern(originator)
+
+        artifacts = data.get("artifacts")
+        kwargs["artifacts"] = [Artifact.from_dict(a) for a in artifacts] if artifacts else []
+
+        return cls(**kwargs)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API request dictionary."""
@@ -485,3 +535,31 @@ class Activity:
         if self.artifacts:
             result["artifacts"] = [a.to_dict() for a in self.artifacts]
         return result
+
+    def __hash__(self) -> int:
+        """Hash by ID; equality still compares every field."""
+        return hash(self.id)
+
+
+# API key -> attribute name for Activity fields copied as-is from responses
+_ACTIVITY_FIELDS: Dict[str, str] = {
+    "name": "name",
+    "id": "id",
+    "description": "description",
+    "createTime": "create_time",
+    "originator": "originator",
+    "agentMessaged": "agent_messaged",
+    "userMessaged": "user_messaged",
+    "planGenerated": "plan_generated",
+    "planApproved": "plan_approved",
+    "progressUpdated": "progress_updated",
+    "sessionCompleted": "session_completed",
+    "sessionFailed": "session_failed",
+}
+_ACTIVITY_DEFAULTS: Dict[str, Any] = {
+    "name": "",
+    "id": "",
+    "description": "",
+    "create_time": "",
+    "originator": "",
+}
@@ -0,0 +1,101 @@
+"""Client-side request throttling for the async Jules API client."""
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Mapping
+
+# Header values above this are treated as absolute epoch timestamps, below as
+# relative seconds
+_EPOCH_THRESHOLD = 10**9
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a delay header (``Retry-After``/``X-RateLimit-Reset``) into seconds.
+
+    Accepts delays in seconds, epoch timestamps and HTTP dates.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError):
+            return None
+    if seconds > _EPOCH_THRESHOLD:
+        seconds -= time.time()
+    return max(seconds, 0.0)
+
+
+class TokenBucket:
+    """Token bucket limiting how many requests start per second.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``; every
+    request consumes one. With ``rate=None`` the bucket never throttles on its
+    own but still honors pauses requested by the server through
+    :meth:`update_from_headers`.
+
+    Example:
+        >>> bucket = TokenBucket(rate=10)
+        >>> await bucket.acquire()
+    """
+
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Sustained requests per second, or None for no limit
+            capacity: Maximum burst size (defaults to ``max(rate, 1)``)
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("Rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate or 1.0, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        if self.rate is not None:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be issued and consume a token."""
+        while True:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+
+            if self.rate is None:
+                return
+
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for the given number of seconds."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Pause the bucket when the server reports that the rate limit is exhausted.
+
+        Honors ``Retry-After`` and, when ``X-RateLimit-Remaining`` reaches zero,
+        ``X-RateLimit-Reset``.
+
+        Args:
+            headers: Response headers
+        """
+        delay = _parse_seconds(headers.get("Retry-After"))
+        if delay is None and headers.get("X-RateLimit-Remaining") == "0":
+            delay = _parse_seconds(headers.get("X-RateLimit-Reset"))
+        if delay:
+            self.pause(delay)
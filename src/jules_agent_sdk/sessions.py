@@ -1,20 +1,49 @@
 """Sessions API module."""
 
+import random
 import time
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any, ClassVar, FrozenSet, Iterator
 
 from jules_agent_sdk.models import Session, SessionState
-from jules_agent_sdk.base import BaseClient
+from jules_agent_sdk.base import BaseClient, _normalize_session
+from jules_agent_sdk.cache import SESSION_CACHE_TTL, LIST_CACHE_TTL
 from jules_agent_sdk.exceptions import JulesAPIError
 
 # Constants for session polling
-DEFAULT_POLL_INTERVAL = 5
+DEFAULT_POLL_INTERVAL = 1.0
 DEFAULT_TIMEOUT = 600
+DEFAULT_MAX_POLL_INTERVAL = 10.0
+DEFAULT_POLL_MULTIPLIER = 2.0
+DEFAULT_POLL_JITTER = 0.1
+
+
+def _create_session_payload(
+    prompt: str,
+    source: str,
+    starting_branch: Optional[str] = None,
+    title: Optional[str] = None,
+    require_plan_approval: bool = False,
+) -> Dict[str, Any]:
+    """Build the request body for creating a session, omitting unset options."""
+    branch = {"startingBranch": starting_branch} if starting_branch else None
+    return {
+        "prompt": prompt,
+        "sourceContext": {
+            "source": source,
+            **({"githubRepoContext": branch} if branch else {}),
+        },
+        **({"title": title} if title else {}),
+        **({"requirePlanApproval": True} if require_plan_approval else {}),
+    }
 
 
 class SessionsAPI:
     """API client for managing Jules sessions."""
 
+    _TERMINAL_STATES: ClassVar[FrozenSet[SessionState]] = frozenset(
+        {SessionState.COMPLETED, SessionState.FAILED}
+    )
+
     def __init__(self, client: BaseClient) -> None:
         """Initialize the Sessions API.
 
@@ -52,28 +81,21 @@ class SessionsAPI:
             ... )
             >>> print(session.id)
         """
-        data: Dict[str, Any] = {
-            "prompt": prompt,
-            "sourceContext": {"source": source},
-        }
-
-        if starting_branch:
-            data["sourceContext"]["githubRepoContext"] = {"startingBranch": starting_branch}
-
-        if title:
-            data["title"] = title
-
-        if require_plan_approval:
-            data["requirePlanApproval"] = require_plan_approval
-
+        data = _create_session_payload(
+            prompt, source, starting_branch, title, require_plan_approval
+        )
         response = self.client.post("sessions", json=data)
+        self.client.cache.invalidate("sessions")
         return Session.from_dict(response)
 
-    def get(self, session_id: str) -> Session:
+    def get(self, session_id: str, cache_ttl: Optional[float] = None) -> Session:
         """Get a single session by ID.
 
         Args:
             session_id: The session ID or full name (e.g., "sessions/abc123" or "abc123")
+            cache_ttl: If set, a response fetched within this many seconds is
+                returned instead of making a request; by default the session
+                is always fetched
 
         Returns:
             Session object
@@ -81,11 +103,23 @@ class SessionsAPI:
         Example:
             >>> session = client.sessions.get("abc123")
             >>> print(session.state)
+            >>> # Collapse a tight polling loop into one request per second
+            >>> session = client.sessions.get("abc123", cache_ttl=1.0)
         """
-        if not session_id.startswith("sessions/"):
-            session_id = f"sessions/{session_id}"
+        if cache_ttl is None:
+            return self._refresh(session_id)
+
+        session_id = _normalize_session(session_id)
+
+        response = self.client.get(session_id, cache_ttl=cache_ttl)
+        return Session.from_dict(response)
+
+    def _refresh(self, session_id: str) -> Session:
+        """Fetch a session bypassing the cache, then store the fresh response."""
+        session_id = _normalize_session(session_id)
 
         response = self.client.get(session_id)
+        self.client.cache.set(session_id, response, SESSION_CACHE_TTL)
         return Session.from_dict(response)
 
     def list(
@@ -111,11 +145,11 @@ class SessionsAPI:
         if page_token:
             params["pageToken"] = page_token
 
-        response = self.client.get("sessions", params=params)
+        response = self.client.get("sessions", params=params, cache_ttl=LIST_CACHE_TTL)
 
         sessions = []
         if response.get("sessions"):
-            sessions = [Session.from_dict(s) for s in response["sessions"]]
+            sessions = list(map(Session.from_dict, response["sessions"]))
 
         return {
             "sessions": sessions,
@@ -131,10 +165,10 @@ class SessionsAPI:
         Example:
             >>> client.sessions.approve_plan("abc123")
         """
-        if not session_id.startswith("sessions/"):
-            session_id = f"sessions/{session_id}"
+        session_id = _normalize_session(session_id)
 
-        self.client.post(f"{session_id}:approvePlan")
+        self.client.post(session_id + ":approvePlan")
+        self._invalidate(session_id)
 
     def send_message(self, session_id: str, prompt: str) -> None:
         """Send a message from the user to a session.
@@ -146,23 +180,42 @@ class SessionsAPI:
         Example:
             >>> client.sessions.send_message("abc123", "Please also add unit tests")
         """
-        if not session_id.startswith("sessions/"):
-            session_id = f"sessions/{session_id}"
+        session_id = _normalize_session(session_id)
 
-        self.client.post(f"{session_id}:sendMessage", json={"prompt": prompt})
+        self.client.post(session_id + ":sendMessage", json={"prompt": prompt})
+        self._invalidate(session_id)
+
+    def _invalidate(self, session_name: str) -> None:
+        """Drop cached responses a write to a session may have made stale."""
+        cache = self.client.cache
+        cache.invalidate(session_name)
+        cache.invalidate(session_name + "/activities")
+        cache.invalidate("sessions")
 
     def wait_for_completion(
         self,
         session_id: str,
-        poll_interval: int = DEFAULT_POLL_INTERVAL,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
         timeout: Optional[int] = DEFAULT_TIMEOUT,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        multiplier: float = DEFAULT_POLL_MULTIPLIER,
+        jitter: float = DEFAULT_POLL_JITTER,
     ) -> Session:
         """Poll a session until it completes or fails.
 
+        Polling backs off exponentially: the delay starts at ``poll_interval``,
+        grows by ``multiplier`` while the state is unchanged (up to
+        ``max_poll_interval``), and resets whenever the state changes. Fast
+        sessions are therefore seen almost immediately while long ones need
+        only a few requests.
+
         Args:
             session_id: The session ID or full name
-            poll_interval: Seconds between polling requests (default: 5)
+            poll_interval: Initial seconds between polling requests (default: 1)
             timeout: Optional timeout in seconds (default: 600)
+            max_poll_interval: Upper bound for the polling delay (default: 10)
+            multiplier: Factor applied to the delay after each unchanged poll (default: 2)
+            jitter: Random fraction applied to each delay (default: 0.1)
 
         Returns:
             Final Session object
@@ -176,21 +229,77 @@ class SessionsAPI:
             >>> final_session = client.sessions.wait_for_completion(session.id)
             >>> print(final_session.state)
         """
-        start_time = time.time()
-        terminal_states = {
-            SessionState.COMPLETED,
-            SessionState.FAILED,
-        }
+        deadline = time.monotonic() + timeout if timeout else None
+        name = _normalize_session(session_id)
+        delay = poll_interval
+        last_state: Optional[SessionState] = None
 
         while True:
-            session = self.get(session_id)
+            session = self._refresh(name)
 
-            if session.state in terminal_states:
+            if session.state in self._TERMINAL_STATES:
                 if session.state == SessionState.FAILED:
                     raise JulesAPIError(f"Session failed: {session_id}")
                 return session
 
-            if timeout and (time.time() - start_time) > timeout:
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining < 0:
                 raise TimeoutError(f"Session polling timed out after {timeout} seconds")
 
-            time.sleep(poll_interval)
+            if session.state == last_state:
+                delay = min(delay * multiplier, max_poll_interval)
+            else:
+                delay = poll_interval
+            last_state = session.state
+
+            # Never sleep past the deadline; the last poll happens right at it
+            pause = delay * random.uniform(1 - jitter, 1 + jitter)
+            time.sleep(pause if remaining is None else min(pause, remaining))
+
+    def subscribe(
+        self,
+        session_id: str,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        jitter: float = DEFAULT_POLL_JITTER,
+    ) -> Iterator[Session]:
+        """Yield the session every time its state changes.
+
+        The Jules API has no push channel for session updates, so this polls
+        with exponential backoff: the delay starts at ``poll_interval``, doubles
+        while the state is unchanged (up to ``max_poll_interval``), and resets
+        after each change. Iteration stops after a terminal state is yielded.
+
+        Args:
+            session_id: The session ID or full name
+            poll_interval: Initial seconds between polling requests (default: 1)
+            max_poll_interval: Upper bound for the polling delay (default: 10)
+            jitter: Random fraction applied to each delay (default: 0.1)
+
+        Yields:
+            Session objects, one per observed state
+
+        Example:
+            >>> for session in client.sessions.subscribe("abc123"):
+            ...     print(session.state)
+            ...     if session.state == SessionState.AWAITING_PLAN_APPROVAL:
+            ...         break
+        """
+        name = _normalize_session(session_id)
+        delay = poll_interval
+        last_state: Optional[SessionState] = None
+
+        while True:
+            session = self._refresh(name)
+
+            if session.state != last_state:
+                last_state = session.state
+                delay = poll_interval
+                yield session
+            else:
+                delay = min(delay * 2, max_poll_interval)
+
+            if session.state in self._TERMINAL_STATES:
+                return
+
+            time.sleep(delay * random.uniform(1 - jitter, 1 + jitter))
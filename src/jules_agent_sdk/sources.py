@@ -1,8 +1,9 @@
 """Sources API module."""
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from jules_agent_sdk.models import Source
-from jules_agent_sdk.base import BaseClient
+from jules_agent_sdk.base import BaseClient, _normalize_source
+from jules_agent_sdk.cache import LIST_CACHE_TTL
 
 
 class SourcesAPI:
@@ -30,8 +31,7 @@ class SourcesAPI:
             >>> if source.github_repo:
             ...     print(f"Repo: {source.github_repo.owner}/{source.github_repo.repo}")
         """
-        if not source_id.startswith("sources/"):
-            source_id = f"sources/{source_id}"
+        source_id = _normalize_source(source_id)
 
         response = self.client.get(source_id)
         return Source.from_dict(response)
@@ -60,6 +60,24 @@ class SourcesAPI:
             >>> if result['nextPageToken']:
             ...     next_page = client.sources.list(page_token=result['nextPageToken'])
         """
+        response = self._list_raw(filter_str, page_size, page_token)
+
+        sources = []
+        if response.get("sources"):
+            sources = list(map(Source.from_dict, response["sources"]))
+
+        return {
+            "sources": sources,
+            "nextPageToken": response.get("nextPageToken"),
+        }
+
+    def _list_raw(
+        self,
+        filter_str: Optional[str] = None,
+        page_size: Optional[int] = None,
+        page_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Fetch one unparsed page of sources."""
         params: Dict[str, Any] = {}
         if filter_str:
             params["filter"] = filter_str
@@ -68,16 +86,38 @@ class SourcesAPI:
         if page_token:
             params["pageToken"] = page_token
 
-        response = self.client.get("sources", params=params)
+        return self.client.get("sources", params=params, cache_ttl=LIST_CACHE_TTL)
 
-        sources = []
-        if response.get("sources"):
-            sources = [Source.from_dict(s) for s in response["sources"]]
+    def iter_all(
+        self, filter_str: Optional[str] = None, page_size: Optional[int] = None
+    ) -> Iterator[Source]:
+        """Iterate over all sources, fetching pages on demand.
 
-        return {
-            "sources": sources,
-            "nextPageToken": response.get("nextPageToken"),
-        }
+        Unlike :meth:`list_all` this never holds more than one page in memory,
+        and stopping early (e.g. with ``break``) skips the remaining requests.
+        Prefer it when scanning a large account for a few matching sources.
+
+        Args:
+            filter_str: Optional filter string
+            page_size: Maximum number of sources per page
+
+        Yields:
+            Source objects in API order
+
+        Example:
+            >>> for source in client.sources.iter_all():
+            ...     if source.github_repo and source.github_repo.repo == "my-repo":
+            ...         break
+        """
+        page_token: Optional[str] = None
+
+        while True:
+            response = self._list_raw(filter_str, page_size, page_token)
+            yield from map(Source.from_dict, response.get("sources") or [])
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
 
     def list_all(self, filter_str: Optional[str] = None) -> List[Source]:
         """List all sources (handles pagination automatically).
@@ -93,15 +133,4 @@ class SourcesAPI:
             >>> github_sources = [s for s in all_sources if s.github_repo]
             >>> print(f"GitHub sources: {len(github_sources)}")
         """
-        all_sources: List[Source] = []
-        page_token: Optional[str] = None
-
-        while True:
-            result = self.list(filter_str=filter_str, page_token=page_token)
-            all_sources.extend(result["sources"])
-
-            page_token = result.get("nextPageToken")
-            if not page_token:
-                break
-
-        return all_sources
+        return list(self.iter_all(filter_str))
@@ -0,0 +1,25 @@
+"""Mock API payloads and expectations shared by the sync and async client tests."""
+
+from importlib.util import find_spec
+from types import MappingProxyType
+
+import pytest
+
+# Session fields shared by the mocked session responses; tests add the state
+SESSION_DATA = MappingProxyType(
+    {
+        "name": "sessions/test123",
+        "id": "test123",
+        "prompt": "Fix bug",
+        "sourceContext": {"source": "sources/repo1"},
+    }
+)
+
+# Content codings both HTTP stacks should advertise; br needs the brotli package
+ACCEPTED_ENCODINGS = [
+    "gzip",
+    pytest.param(
+        "br",
+        marks=pytest.mark.skipif(find_spec("brotli") is None, reason="brotli is not installed"),
+    ),
+]
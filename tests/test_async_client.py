@@ -1,44 +1,116 @@
 """Tests for the async Jules client."""
 
+import asyncio
+import gc
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch
 from jules_agent_sdk import AsyncJulesClient
-from jules_agent_sdk.exceptions import JulesAuthenticationError
+from jules_agent_sdk.exceptions import JulesAPIError, JulesAuthenticationError
+from tests._fixtures import ACCEPTED_ENCODINGS, SESSION_DATA
 
+pytestmark = pytest.mark.asyncio_client
 
-class TestAsyncJulesClient:
-    """Test cases for AsyncJulesClient."""
 
-    def test_async_client_initialization(self):
-        """Test async client initializes correctly."""
-        client = AsyncJulesClient(api_key="test-api-key")
-        assert client is not None
-        assert client.sessions is not None
-        assert client.activities is not None
-        assert client.sources is not None
+class FakeContent:
+    """Stand-in for ``response.content`` handing the body out in small chunks."""
+
+    def __init__(self, data):
+        self.data = data
+
+    async def read(self, n=-1):
+        size = min(n, 8) if n >= 0 else 8
+        chunk, self.data = self.data[:size], self.data[size:]
+        return chunk
+
+
+class FakeResponse:
+    """Stand-in for an aiohttp response with a fixed status, body and headers."""
+
+    def __init__(self, status=200, body=b"{}", headers=None):
+        self.status = status
+        self.ok = status < 400
+        self.body = body
+        self.headers = headers or {}
+        self.content = FakeContent(body)
+
+    async def read(self):
+        return self.body
+
+
+class FakeRequest:
+    """Stand-in for the context manager returned by ``aiohttp.ClientSession.request``."""
+
+    def __init__(self, response=None):
+        self.response = response or FakeResponse()
+
+    async def __aenter__(self):
+        return self.response
 
-    def test_async_client_requires_api_key(self):
-        """Test async client raises error without API key."""
-        with pytest.raises(ValueError, match="API key is required"):
-            AsyncJulesClient(api_key="")
+    async def __aexit__(self, *args):
+        pass
+
+
+def fake_requests(*responses):
+    """Return one FakeRequest per response, for use as a ``side_effect``."""
+    return [FakeRequest(r) for r in responses]
+
+
+class TestAsyncJulesClient:
+    """Test cases for AsyncJulesClient."""
 
-    @pytest.mark.asyncio
     async def test_async_client_context_manager(self):
         """Test async client works as context manager."""
         async with AsyncJulesClient(api_key="test-api-key") as client:
             assert client is not None
 
-    @pytest.mark.asyncio
+    async def test_async_client_reuses_pooled_session(self):
+        """Test the aiohttp session is created once with a pooled connector."""
+        async with AsyncJulesClient(api_key="test-api-key", timeout=15) as client:
+            session = await client._base_client._get_session()
+            assert await client._base_client._get_session() is session
+            assert session.connector.limit_per_host == 64
+            assert session.timeout.total == 15
+
+    @pytest.mark.parametrize("encoding", ACCEPTED_ENCODINGS)
+    async def test_async_client_requests_compressed_responses(self, encoding):
+        """Test requests from the aiohttp session advertise compressed encodings."""
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        async def echo_encoding(request):
+            return web.json_response({"encoding": request.headers.get("Accept-Encoding", "")})
+
+        app = web.Application()
+        app.router.add_get("/sources", echo_encoding)
+        async with TestServer(app) as server:
+            base_url = str(server.make_url(""))
+            async with AsyncJulesClient(api_key="test-api-key", base_url=base_url) as client:
+                result = await client._base_client._request("GET", "sources")
+
+        assert encoding in result["encoding"]
+
+    async def test_async_client_rejects_requests_after_close(self):
+        """Test a closed client raises instead of silently reopening a session."""
+        client = AsyncJulesClient(api_key="test-api-key")
+        await client._base_client._get_session()
+        await client.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            await client._base_client._get_session()
+
+    async def test_async_client_connector_is_configurable(self):
+        """Test connector limits are passed through to the aiohttp connector."""
+        async with AsyncJulesClient(
+            api_key="test-api-key", connector_limit=32, connector_limit_per_host=8
+        ) as client:
+            session = await client._base_client._get_session()
+            assert session.connector.limit == 32
+            assert session.connector.limit_per_host == 8
+
     @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
     async def test_async_sessions_create(self, mock_request):
         """Test async session creation."""
-        mock_request.return_value = {
-            "name": "sessions/test123",
-            "id": "test123",
-            "prompt": "Fix bug",
-            "sourceContext": {"source": "sources/repo1"},
-            "state": "QUEUED",
-        }
+        mock_request.return_value = {**SESSION_DATA, "state": "QUEUED"}
 
         client = AsyncJulesClient(api_key="test-api-key")
         session = await client.sessions.create(
@@ -48,7 +120,34 @@ class TestAsyncJulesClient:
         assert session.id == "test123"
         assert session.prompt == "Fix bug"
 
-    @pytest.mark.asyncio
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_sessions_get_caches_only_when_asked(self, mock_request):
+        """Test async session gets always fetch unless a cache_ttl is given."""
+        mock_request.return_value = {**SESSION_DATA, "state": "QUEUED"}
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        await client.sessions.get("test123")
+        await client.sessions.get("test123")
+        await client.sessions.get("test123", cache_ttl=1.0)
+
+        assert mock_request.call_count == 2
+
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_activities_list_after_send_message_is_fresh(self, mock_request):
+        """Test a message sent to a session drops its cached activity pages."""
+        mock_request.side_effect = [
+            {"activities": [{"name": "sessions/s1/activities/a1", "id": "a1"}]},
+            {},
+            {"activities": [{"name": "sessions/s1/activities/a2", "id": "a2"}]},
+        ]
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        await client.activities.list("s1")
+        await client.sessions.send_message("s1", "Also add tests")
+        result = await client.activities.list("s1")
+
+        assert [a.id for a in result["activities"]] == ["a2"]
+
     @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
     async def test_async_sessions_list(self, mock_request):
         """Test async listing sessions."""
@@ -69,7 +168,27 @@ class TestAsyncJulesClient:
         assert len(result["sessions"]) == 1
         assert result["sessions"][0].id == "test1"
 
-    @pytest.mark.asyncio
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_listed_activities_are_cached_as_copies(self, mock_request):
+        """Test modifying a listed activity does not change the cached one."""
+        mock_request.return_value = {
+            "activities": [
+                {
+                    "name": "sessions/s1/activities/a1",
+                    "id": "a1",
+                    "agentMessaged": {"agentMessage": "Done"},
+                }
+            ]
+        }
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        listed = (await client.activities.list("s1"))["activities"][0]
+        listed.agent_messaged["agentMessage"] = "MUTATED"
+
+        activity = await client.activities.get("s1", "a1")
+        assert activity.agent_messaged == {"agentMessage": "Done"}
+        assert mock_request.call_count == 1
+
     @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
     async def test_async_activities_list_all(self, mock_request):
         """Test async listing all activities with pagination."""
@@ -93,3 +212,452 @@ class TestAsyncJulesClient:
         assert len(activities) == 2
         assert activities[0].id == "a1"
         assert activities[1].id == "a2"
+
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_sources_list_all(self, mock_request):
+        """Test async listing all sources follows page tokens."""
+        mock_request.side_effect = [
+            {"sources": [{"name": "sources/src1", "id": "src1"}], "nextPageToken": "token1"},
+            {"sources": [{"name": "sources/src2", "id": "src2"}]},
+        ]
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        sources = await client.sources.list_all(filter_str="name=repo")
+
+        assert [s.id for s in sources] == ["src1", "src2"]
+        assert mock_request.call_args_list[1].kwargs["params"] == {
+            "filter": "name=repo",
+            "pageToken": "token1",
+        }
+
+    @patch("jules_agent_sdk.async_client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_wait_for_completion_backoff(self, mock_request, mock_sleep):
+        """Test polling backs off while state is unchanged and resets on change."""
+        mock_request.side_effect = [
+            {**SESSION_DATA, "state": "QUEUED"},
+            {**SESSION_DATA, "state": "QUEUED"},
+            {**SESSION_DATA, "state": "QUEUED"},
+            {**SESSION_DATA, "state": "IN_PROGRESS"},
+            {**SESSION_DATA, "state": "COMPLETED"},
+        ]
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        session = await client.sessions.wait_for_completion(
+            "s1", poll_interval=1, max_poll_interval=3, jitter=0
+        )
+
+        assert session.state.value == "COMPLETED"
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [1, 2, 3, 1]
+
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_wait_for_completion_sleep_stops_at_deadline(self, mock_request):
+        """Test the backoff sleep is cut short so polling ends at the deadline."""
+        mock_request.return_value = {**SESSION_DATA, "state": "IN_PROGRESS"}
+        real_sleep = asyncio.sleep
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        with patch(
+            "jules_agent_sdk.async_client.asyncio.sleep", side_effect=real_sleep
+        ) as mock_sleep:
+            with pytest.raises(TimeoutError):
+                await client.sessions.wait_for_completion(
+                    "test123", poll_interval=10, timeout=0.05, jitter=0
+                )
+
+        assert all(c.args[0] <= 0.05 for c in mock_sleep.call_args_list)
+
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_activities_iter_pages_propagates_errors(self, mock_request):
+        """Test errors from the prefetch task surface in the consumer."""
+        mock_request.side_effect = [
+            {
+                "activities": [{"name": "sessions/s1/activities/a1", "id": "a1"}],
+                "nextPageToken": "token1",
+            },
+            JulesAuthenticationError("Invalid API key", 401),
+        ]
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        pages = []
+        with pytest.raises(JulesAuthenticationError):
+            async for page in client.activities.iter_pages("s1"):
+                pages.append(page)
+
+        assert len(pages) == 1
+        assert pages[0][0].id == "a1"
+
+    @patch("jules_agent_sdk.async_client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_session_watcher(self, mock_request, mock_sleep):
+        """Test one watcher resolves several sessions from a shared poll loop."""
+        states = {"s1": ["IN_PROGRESS", "COMPLETED"], "s2": ["FAILED"]}
+
+        async def respond(method, path, params=None, json=None):
+            session_id = path.split("/")[-1]
+            return {
+                "name": path,
+                "id": session_id,
+                "prompt": "Task",
+                "sourceContext": {"source": "sources/repo1"},
+                "state": states[session_id].pop(0),
+            }
+
+        mock_request.side_effect = respond
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        watcher = client.sessions.watch(jitter=0)
+        results = await asyncio.gather(
+            watcher.wait("s1"), watcher.wait("s2"), return_exceptions=True
+        )
+        await watcher.close()
+
+        assert results[0].state.value == "COMPLETED"
+        assert isinstance(results[1], JulesAPIError)
+        assert mock_request.call_count == 3
+        assert mock_sleep.call_count == 1
+
+    @patch("jules_agent_sdk.async_client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_sessions_wait_for_all(self, mock_request, mock_sleep):
+        """Test waiting on several sessions returns them in input order."""
+        states = {"s1": ["IN_PROGRESS", "COMPLETED"], "s2": ["COMPLETED"]}
+
+        async def respond(method, path, params=None, json=None):
+            session_id = path.split("/")[-1]
+            return {
+                "name": path,
+                "id": session_id,
+                "prompt": "Task",
+                "sourceContext": {"source": "sources/repo1"},
+                "state": states[session_id].pop(0),
+            }
+
+        mock_request.side_effect = respond
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        results = await client.sessions.wait_for_all(["s1", "s2"], jitter=0)
+
+        assert [s.id for s in results] == ["s1", "s2"]
+        assert all(s.state.value == "COMPLETED" for s in results)
+        assert mock_request.call_count == 3
+
+    @patch("jules_agent_sdk.async_client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_watcher_shares_poll_across_id_aliases(self, mock_request, mock_sleep):
+        """Test waiting on a bare ID and its full name polls the session once."""
+        mock_request.return_value = {**SESSION_DATA, "state": "COMPLETED"}
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        watcher = client.sessions.watch(jitter=0)
+        first, second = await asyncio.gather(
+            watcher.wait("test123"), watcher.wait("sessions/test123")
+        )
+        await watcher.close()
+
+        assert first is second
+        assert mock_request.call_count == 1
+
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_watcher_stops_polling_when_waits_are_cancelled(self, mock_request):
+        """Test cancelling the last wait on a session stops the polling task."""
+        mock_request.return_value = {**SESSION_DATA, "state": "IN_PROGRESS"}
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        watcher = client.sessions.watch(poll_interval=0.01, jitter=0)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(watcher.wait("test123"), timeout=0.05)
+        await asyncio.gather(watcher._task, return_exceptions=True)
+
+        assert watcher._waiters == {}
+        assert watcher._task.done()
+
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_sessions_wait_for_all_timeout(self, mock_request):
+        """Test wait_for_all gives up once its timeout passes."""
+        mock_request.return_value = {**SESSION_DATA, "state": "IN_PROGRESS"}
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        with pytest.raises(TimeoutError, match="timed out"):
+            await client.sessions.wait_for_all(["test123"], poll_interval=0.01, timeout=0.05)
+
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_activities_list_all_many(self, mock_request):
+        """Test listing activities for several sessions concurrently."""
+
+        async def respond(method, path, params=None, json=None):
+            session_name = path.rsplit("/", 1)[0]
+            return {"activities": [{"name": f"{session_name}/activities/a1", "id": "a1"}]}
+
+        mock_request.side_effect = respond
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        result = await client.activities.list_all_many(["s1", "s2"])
+
+        assert list(result) == ["s1", "s2"]
+        assert result["s2"][0].name == "sessions/s2/activities/a1"
+        assert [a.id async for a in client.activities.iter("s1")] == ["a1"]
+
+    @patch("jules_agent_sdk.async_client.asyncio.sleep", new_callable=AsyncMock)
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_sessions_subscribe(self, mock_request, mock_sleep):
+        """Test async subscribe yields each new state until a terminal one."""
+        mock_request.side_effect = [
+            {**SESSION_DATA, "state": "PLANNING"},
+            {**SESSION_DATA, "state": "AWAITING_PLAN_APPROVAL"},
+            {**SESSION_DATA, "state": "AWAITING_PLAN_APPROVAL"},
+            {**SESSION_DATA, "state": "FAILED"},
+        ]
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        states = [s.state.value async for s in client.sessions.subscribe("s1")]
+
+        assert states == ["PLANNING", "AWAITING_PLAN_APPROVAL", "FAILED"]
+        assert mock_request.call_count == 4
+
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_identical_gets_are_coalesced(self, mock_request):
+        """Test concurrent identical GETs share one in-flight request."""
+
+        async def respond(method, path, params=None, json=None):
+            await asyncio.sleep(0)
+            return {"sources": [{"name": "sources/src1", "id": "src1"}]}
+
+        mock_request.side_effect = respond
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        first, second = await asyncio.gather(
+            client._base_client.get("sources"), client._base_client.get("sources")
+        )
+
+        assert first is second
+        assert mock_request.call_count == 1
+
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_cancelled_get_cancels_request(self, mock_request, caplog):
+        """Test cancelling the only caller cancels the shared request without log noise."""
+        cancelled = asyncio.Event()
+
+        async def respond(method, path, params=None, json=None):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_request.side_effect = respond
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client._base_client.get("sources"), timeout=0.01)
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert client._base_client._inflight == {}
+        gc.collect()
+        assert "never retrieved" not in caplog.text
+
+    async def test_async_activities_list_all_many_cancels_on_error(self):
+        """Test a failing session cancels the other in-flight listings."""
+        cancelled = []
+
+        async def list_all(session_id):
+            if session_id == "bad":
+                raise JulesAuthenticationError("Invalid API key", 401)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(session_id)
+                raise
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        with patch.object(client.activities, "list_all", side_effect=list_all):
+            with pytest.raises(JulesAuthenticationError):
+                await client.activities.list_all_many(["slow", "bad"])
+            await asyncio.sleep(0)
+
+        assert cancelled == ["slow"]
+
+    async def test_async_requests_respect_max_concurrency(self):
+        """Test no more than max_concurrency requests are in flight at once."""
+        active = 0
+        peak = 0
+
+        class CountingRequest(FakeRequest):
+            async def __aenter__(self):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                return self.response
+
+            async def __aexit__(self, *args):
+                nonlocal active
+                active -= 1
+
+        async with AsyncJulesClient(api_key="test-api-key", max_concurrency=2) as client:
+            with patch("aiohttp.ClientSession.request", return_value=CountingRequest()):
+                await asyncio.gather(
+                    *(client._base_client._request("GET", f"sessions/{i}") for i in range(6))
+                )
+
+        assert peak == 2
+
+    async def test_async_rate_limit_wait_does_not_hold_a_slot(self):
+        """Test requests wait for a rate-limit token before taking a concurrency slot."""
+        slot_taken = []
+
+        async with AsyncJulesClient(api_key="test-api-key", max_concurrency=1, max_rps=1) as client:
+            base = client._base_client
+
+            async def acquire():
+                slot_taken.append(base._get_semaphore().locked())
+
+            with patch.object(base.rate_limiter, "acquire", side_effect=acquire), patch(
+                "aiohttp.ClientSession.request", return_value=FakeRequest()
+            ):
+                await base._request("GET", "sessions/s1")
+                async with base._stream("GET", "sessions/s2"):
+                    pass
+
+        assert slot_taken == [False, False]
+
+    async def test_async_rate_limiter_pauses_on_retry_after(self):
+        """Test the token bucket holds requests back after a Retry-After header."""
+        from jules_agent_sdk.ratelimit import TokenBucket
+
+        bucket = TokenBucket()
+        bucket.update_from_headers({"Retry-After": "2"})
+
+        async def fake_sleep(delay):
+            bucket._blocked_until = 0.0
+
+        with patch("jules_agent_sdk.ratelimit.asyncio.sleep", side_effect=fake_sleep) as mock_sleep:
+            await bucket.acquire()
+
+        assert 1.9 < mock_sleep.call_args.args[0] <= 2
+
+    async def test_async_error_with_non_json_body(self):
+        """Test a non-JSON error body is surfaced as the error message."""
+        response = FakeResponse(502, b"Bad Gateway")
+
+        async with AsyncJulesClient(api_key="test-api-key", max_retries=1) as client:
+            with patch("aiohttp.ClientSession.request", return_value=FakeRequest(response)):
+                with pytest.raises(JulesAPIError, match="Bad Gateway") as exc_info:
+                    await client._base_client._request("GET", "sessions")
+
+        assert exc_info.value.status_code == 502
+
+    @patch("jules_agent_sdk.async_base.AsyncBaseClient._request")
+    async def test_async_activities_stream_all_without_ijson(self, mock_request):
+        """Test stream_all falls back to page-by-page listing without ijson."""
+        mock_request.side_effect = [
+            {"activities": [{"name": "sessions/s1/activities/a1", "id": "a1"}]},
+        ]
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        with patch("jules_agent_sdk.async_client.ijson", None):
+            activities = [a async for a in client.activities.stream_all("s1", page_size=5)]
+
+        assert [a.id for a in activities] == ["a1"]
+        assert mock_request.call_args.kwargs["params"] == {"pageSize": 5}
+
+    async def test_async_activities_stream_all(self):
+        """Test stream_all parses activities incrementally across pages."""
+        pytest.importorskip("ijson")
+        from contextlib import asynccontextmanager
+
+        pages = [
+            b'{"activities": [{"name": "sessions/s1/activities/a1", "id": "a1"},'
+            b' {"name": "sessions/s1/activities/a2", "id": "a2"}], "nextPageToken": "t1"}',
+            b'{"activities": [{"name": "sessions/s1/activities/a3", "id": "a3"}]}',
+        ]
+        calls = []
+
+        @asynccontextmanager
+        async def fake_stream(method, path, params=None, json=None):
+            calls.append((path, params))
+            yield FakeResponse(body=pages[len(calls) - 1])
+
+        client = AsyncJulesClient(api_key="test-api-key")
+        with patch.object(client._base_client, "_stream", side_effect=fake_stream):
+            activities = [a async for a in client.activities.stream_all("s1")]
+
+        assert [a.id for a in activities] == ["a1", "a2", "a3"]
+        assert calls == [
+            ("sessions/s1/activities", {}),
+            ("sessions/s1/activities", {"pageToken": "t1"}),
+        ]
+
+    @patch("jules_agent_sdk.async_base.asyncio.sleep", new_callable=AsyncMock)
+    async def test_async_request_retries_transient_errors(self, mock_sleep):
+        """Test 429/5xx responses are retried, honoring Retry-After."""
+        responses = fake_requests(
+            FakeResponse(429, b"{}", {"Retry-After": "5"}),
+            FakeResponse(503, b"{}"),
+            FakeResponse(200, b'{"sources": []}'),
+        )
+
+        async with AsyncJulesClient(api_key="test-api-key") as client:
+            # Keep the throttle out of the way so only retry sleeps are recorded
+            with patch.object(client._base_client.rate_limiter, "update_from_headers"), patch(
+                "aiohttp.ClientSession.request", side_effect=responses
+            ):
+                result = await client._base_client._request("GET", "sources")
+
+        assert result == {"sources": []}
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [5.0, 2.0]
+
+    @patch("jules_agent_sdk.async_base.asyncio.sleep", new_callable=AsyncMock)
+    async def test_async_stream_retries_before_yielding(self, mock_sleep):
+        """Test a transient error opening a stream is retried like any request."""
+        responses = fake_requests(FakeResponse(503, b"{}"), FakeResponse(200, b"[1]"))
+
+        async with AsyncJulesClient(api_key="test-api-key") as client:
+            with patch("aiohttp.ClientSession.request", side_effect=responses):
+                async with client._base_client._stream("GET", "sources") as response:
+                    body = await response.read()
+
+        assert body == b"[1]"
+        assert mock_sleep.await_count == 1
+
+    async def test_async_stream_releases_slot_before_yielding(self):
+        """Test requests made while consuming a stream do not wait on its slot."""
+        async with AsyncJulesClient(api_key="test-api-key", max_concurrency=1) as client:
+            with patch(
+                "aiohttp.ClientSession.request",
+                side_effect=fake_requests(FakeResponse(), FakeResponse(body=b'{"id": "s1"}')),
+            ):
+                async with client._base_client._stream("GET", "sources"):
+                    result = await asyncio.wait_for(
+                        client._base_client._request("GET", "sessions/s1"), timeout=1
+                    )
+
+        assert result == {"id": "s1"}
+
+    async def test_async_chunked_response_is_parsed(self):
+        """Test bodies without Content-Length (chunked encoding) are still parsed."""
+        response = FakeResponse(body=b'{"sources": [{"name": "sources/src1", "id": "src1"}]}')
+
+        async with AsyncJulesClient(api_key="test-api-key") as client:
+            with patch("aiohttp.ClientSession.request", return_value=FakeRequest(response)):
+                result = await client.sources.list()
+
+        assert result["sources"][0].id == "src1"
+
+    async def test_async_conditional_get_reuses_body_on_not_modified(self):
+        """Test async GETs revalidate with If-None-Match and reuse the body on 304."""
+        responses = fake_requests(
+            FakeResponse(200, b'{"id": "s1", "state": "QUEUED"}', {"ETag": '"v1"'}),
+            FakeResponse(304, b""),
+        )
+
+        async with AsyncJulesClient(api_key="test-api-key") as client:
+            with patch("aiohttp.ClientSession.request", side_effect=responses) as mock_request:
+                first = await client._base_client.get("sessions/s1")
+                # Changing a returned body must not leak into the stored validator
+                first["state"] = "MUTATED"
+                result = await client._base_client.get("sessions/s1")
+
+        assert result == {"id": "s1", "state": "QUEUED"}
+        assert mock_request.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
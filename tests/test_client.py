@@ -1,26 +1,48 @@
 """Tests for the Jules client."""
 
+import json
+import pickle
+import subprocess
+import sys
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+import requests
+from unittest.mock import Mock, patch
 from jules_agent_sdk import JulesClient
-from jules_agent_sdk.exceptions import JulesAuthenticationError, JulesValidationError
+from jules_agent_sdk.exceptions import (
+    JulesAPIError,
+    JulesAuthenticationError,
+    JulesRateLimitError,
+    JulesValidationError,
+)
+from tests._fixtures import ACCEPTED_ENCODINGS, SESSION_DATA
+
+pytestmark = pytest.mark.sync
+
+
+def fake_response(**attrs):
+    """Build a ``requests.Response`` stand-in; attributes a real response lacks raise."""
+    attrs.setdefault("headers", {})
+    attrs.setdefault("url", "https://jules.googleapis.com/v1alpha/sessions")
+    return Mock(spec=requests.Response, **attrs)
 
 
 class TestJulesClient:
     """Test cases for JulesClient."""
 
-    def test_client_initialization(self):
-        """Test client initializes correctly."""
+    @pytest.mark.parametrize("encoding", ACCEPTED_ENCODINGS)
+    def test_client_requests_compressed_responses(self, encoding):
+        """Test the HTTP session advertises compressed response encodings."""
         client = JulesClient(api_key="test-api-key")
-        assert client is not None
-        assert client.sessions is not None
-        assert client.activities is not None
-        assert client.sources is not None
+        assert encoding in client._base_client.session.headers["Accept-Encoding"]
 
-    def test_client_requires_api_key(self):
-        """Test client raises error without API key."""
-        with pytest.raises(ValueError, match="API key is required"):
-            JulesClient(api_key="")
+    def test_package_import_is_lazy(self):
+        """Test importing the package does not load the HTTP libraries."""
+        code = (
+            "import sys, jules_agent_sdk; "
+            "assert 'requests' not in sys.modules and 'aiohttp' not in sys.modules; "
+            "assert jules_agent_sdk.JulesClient is not None"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
 
     def test_client_context_manager(self):
         """Test client works as context manager."""
@@ -30,13 +52,7 @@ class TestJulesClient:
     @patch("jules_agent_sdk.base.BaseClient._request")
     def test_sessions_create(self, mock_request):
         """Test session creation."""
-        mock_request.return_value = {
-            "name": "sessions/test123",
-            "id": "test123",
-            "prompt": "Fix bug",
-            "sourceContext": {"source": "sources/repo1"},
-            "state": "QUEUED",
-        }
+        mock_request.return_value = {**SESSION_DATA, "state": "QUEUED"}
 
         client = JulesClient(api_key="test-api-key")
         session = client.sessions.create(
@@ -46,17 +62,18 @@ class TestJulesClient:
         assert session.id == "test123"
         assert session.prompt == "Fix bug"
         mock_request.assert_called_once()
+        assert mock_request.call_args.kwargs["json"] == {
+            "prompt": "Fix bug",
+            "sourceContext": {
+                "source": "sources/repo1",
+                "githubRepoContext": {"startingBranch": "main"},
+            },
+        }
 
     @patch("jules_agent_sdk.base.BaseClient._request")
     def test_sessions_get(self, mock_request):
         """Test getting a session."""
-        mock_request.return_value = {
-            "name": "sessions/test123",
-            "id": "test123",
-            "prompt": "Fix bug",
-            "sourceContext": {"source": "sources/repo1"},
-            "state": "IN_PROGRESS",
-        }
+        mock_request.return_value = {**SESSION_DATA, "state": "IN_PROGRESS"}
 
         client = JulesClient(api_key="test-api-key")
         session = client.sessions.get("test123")
@@ -64,6 +81,110 @@ class TestJulesClient:
         assert session.id == "test123"
         assert session.state.value == "IN_PROGRESS"
 
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_sessions_get_is_cached(self, mock_request):
+        """Test session gets use the cache only when asked to, until invalidated."""
+        mock_request.return_value = {**SESSION_DATA, "state": "AWAITING_PLAN_APPROVAL"}
+
+        client = JulesClient(api_key="test-api-key")
+        client.sessions.get("test123")
+        client.sessions.get("sessions/test123", cache_ttl=1.0)
+        assert mock_request.call_count == 1
+
+        client.sessions.get("test123")
+        assert mock_request.call_count == 2
+
+        client.sessions.approve_plan("test123")
+        client.sessions.get("test123", cache_ttl=1.0)
+        assert mock_request.call_count == 4
+
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_activities_list_after_send_message_is_fresh(self, mock_request):
+        """Test a message sent to a session drops its cached activity pages."""
+        first = {"activities": [{"name": "sessions/test123/activities/a1", "id": "a1"}]}
+        second = {
+            "activities": [
+                {"name": "sessions/test123/activities/a1", "id": "a1"},
+                {"name": "sessions/test123/activities/a2", "id": "a2"},
+            ]
+        }
+        mock_request.side_effect = [first, {}, second]
+
+        client = JulesClient(api_key="test-api-key")
+        client.activities.list("test123")
+        client.sessions.send_message("test123", "Also add tests")
+        result = client.activities.list("test123")
+
+        assert [a.id for a in result["activities"]] == ["a1", "a2"]
+        assert mock_request.call_count == 3
+
+    @patch("jules_agent_sdk.sessions.time.sleep")
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_sessions_subscribe(self, mock_request, mock_sleep):
+        """Test subscribe yields only state changes and stops at a terminal state."""
+        mock_request.side_effect = [
+            {**SESSION_DATA, "state": "PLANNING"},
+            {**SESSION_DATA, "state": "PLANNING"},
+            {**SESSION_DATA, "state": "IN_PROGRESS"},
+            {**SESSION_DATA, "state": "COMPLETED"},
+        ]
+
+        client = JulesClient(api_key="test-api-key")
+        states = [s.state.value for s in client.sessions.subscribe("test123", jitter=0)]
+
+        assert states == ["PLANNING", "IN_PROGRESS", "COMPLETED"]
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 1.0]
+
+    @patch("jules_agent_sdk.sessions.time.sleep")
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_sessions_wait_for_completion_backoff(self, mock_request, mock_sleep):
+        """Test polling grows by the multiplier up to the cap and resets on change."""
+        mock_request.side_effect = [
+            {**SESSION_DATA, "state": "QUEUED"},
+            {**SESSION_DATA, "state": "QUEUED"},
+            {**SESSION_DATA, "state": "QUEUED"},
+            {**SESSION_DATA, "state": "IN_PROGRESS"},
+            {**SESSION_DATA, "state": "COMPLETED"},
+        ]
+
+        client = JulesClient(api_key="test-api-key")
+        session = client.sessions.wait_for_completion(
+            "test123", poll_interval=0.5, max_poll_interval=1.0, multiplier=1.5, jitter=0
+        )
+
+        assert session.state.value == "COMPLETED"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 0.75, 1.0, 0.5]
+
+    @patch("jules_agent_sdk.sessions.time")
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_sessions_wait_for_completion_timeout(self, mock_request, mock_time):
+        """Test the timeout is measured on the monotonic clock."""
+        mock_request.return_value = {**SESSION_DATA, "state": "IN_PROGRESS"}
+        mock_time.monotonic.side_effect = [100.0, 105.0, 111.0]
+
+        client = JulesClient(api_key="test-api-key")
+        with pytest.raises(TimeoutError):
+            client.sessions.wait_for_completion("test123", timeout=10, jitter=0)
+
+        assert mock_request.call_count == 2
+        assert mock_time.sleep.call_count == 1
+        mock_time.time.assert_not_called()
+
+    @patch("jules_agent_sdk.sessions.time")
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_sessions_wait_for_completion_sleep_stops_at_deadline(self, mock_request, mock_time):
+        """Test the backoff sleep is cut short so polling ends at the deadline."""
+        mock_request.return_value = {**SESSION_DATA, "state": "IN_PROGRESS"}
+        mock_time.monotonic.side_effect = [100.0, 100.0, 108.0, 111.0]
+
+        client = JulesClient(api_key="test-api-key")
+        with pytest.raises(TimeoutError):
+            client.sessions.wait_for_completion(
+                "test123", poll_interval=5, timeout=10, multiplier=2, jitter=0
+            )
+
+        assert [c.args[0] for c in mock_time.sleep.call_args_list] == [5, 2.0]
+
     @patch("jules_agent_sdk.base.BaseClient._request")
     def test_sessions_list(self, mock_request):
         """Test listing sessions."""
@@ -91,6 +212,21 @@ class TestJulesClient:
         assert len(result["sessions"]) == 2
         assert result["nextPageToken"] == "next-page"
 
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_sessions_list_repeated_calls_are_cached(self, mock_request):
+        """Test identical list calls within the TTL reuse the previous response."""
+        mock_request.return_value = {"sessions": []}
+
+        client = JulesClient(api_key="test-api-key")
+        client.sessions.list(page_size=5)
+        client.sessions.list(page_size=5)
+        client.sessions.list(page_size=10)
+        assert mock_request.call_count == 2
+
+        client.cache.invalidate("sessions")
+        client.sessions.list(page_size=5)
+        assert mock_request.call_count == 3
+
     @patch("jules_agent_sdk.base.BaseClient._request")
     def test_activities_list(self, mock_request):
         """Test listing activities."""
@@ -115,6 +251,97 @@ class TestJulesClient:
         assert len(result["activities"]) == 2
         assert result["activities"][0].id == "a1"
 
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_activities_iter_pages(self, mock_request):
+        """Test iterating activity pages lazily."""
+        mock_request.side_effect = [
+            {
+                "activities": [{"name": "sessions/s1/activities/a1", "id": "a1"}],
+                "nextPageToken": "token1",
+            },
+            {"activities": [{"name": "sessions/s1/activities/a2", "id": "a2"}]},
+        ]
+
+        client = JulesClient(api_key="test-api-key")
+        pages = client.activities.iter_pages("s1")
+
+        assert [a.id for a in next(pages)] == ["a1"]
+        assert mock_request.call_count == 1
+        assert [a.id for a in next(pages)] == ["a2"]
+        assert mock_request.call_args.kwargs["params"] == {"pageToken": "token1"}
+
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_activities_iter_stops_fetching_on_break(self, mock_request):
+        """Test breaking out of iter() skips the remaining page requests."""
+        mock_request.side_effect = [
+            {
+                "activities": [
+                    {"name": "sessions/s1/activities/a1", "id": "a1"},
+                    {"name": "sessions/s1/activities/a2", "id": "a2"},
+                ],
+                "nextPageToken": "token1",
+            },
+        ]
+
+        client = JulesClient(api_key="test-api-key")
+        for activity in client.activities.iter("s1"):
+            break
+
+        assert activity.id == "a1"
+        assert mock_request.call_count == 1
+
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_activities_get_after_list_uses_cache(self, mock_request):
+        """Test activities seen in a listing are returned by get() without a request."""
+        mock_request.return_value = {
+            "activities": [
+                {"name": "sessions/s1/activities/a1", "id": "a1", "description": "Act 1"}
+            ]
+        }
+
+        client = JulesClient(api_key="test-api-key")
+        client.activities.list("s1")
+        activity = client.activities.get("s1", "a1")
+
+        assert activity.description == "Act 1"
+        assert mock_request.call_count == 1
+
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_cached_responses_are_copied_per_caller(self, mock_request):
+        """Test modifying a cached result does not change what later callers get."""
+        mock_request.return_value = {
+            "name": "sessions/s1/activities/a1",
+            "id": "a1",
+            "agentMessaged": {"agentMessage": "Done"},
+        }
+
+        client = JulesClient(api_key="test-api-key")
+        client.activities.get("s1", "a1").agent_messaged["agentMessage"] = "MUTATED"
+        activity = client.activities.get("s1", "a1")
+
+        assert activity.agent_messaged == {"agentMessage": "Done"}
+        assert mock_request.call_count == 1
+
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_listed_activities_are_cached_as_copies(self, mock_request):
+        """Test modifying a listed activity does not change the cached one."""
+        mock_request.return_value = {
+            "activities": [
+                {
+                    "name": "sessions/s1/activities/a1",
+                    "id": "a1",
+                    "agentMessaged": {"agentMessage": "Done"},
+                }
+            ]
+        }
+
+        client = JulesClient(api_key="test-api-key")
+        listed = client.activities.list("s1")["activities"][0]
+        listed.agent_messaged["agentMessage"] = "MUTATED"
+
+        assert client.activities.get("s1", "a1").agent_messaged == {"agentMessage": "Done"}
+        assert mock_request.call_count == 1
+
     @patch("jules_agent_sdk.base.BaseClient._request")
     def test_sources_list(self, mock_request):
         """Test listing sources."""
@@ -135,6 +362,68 @@ class TestJulesClient:
         assert result["sources"][0].id == "src1"
         assert result["sources"][0].github_repo.owner == "test"
 
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_sources_list_all(self, mock_request):
+        """Test list_all follows page tokens and keeps sources in order."""
+        mock_request.side_effect = [
+            {"sources": [{"name": "sources/src1", "id": "src1"}], "nextPageToken": "p2"},
+            {"sources": [{"name": "sources/src2", "id": "src2"}]},
+        ]
+
+        client = JulesClient(api_key="test-api-key")
+        sources = client.sources.list_all(filter_str="name=repo")
+
+        assert [s.id for s in sources] == ["src1", "src2"]
+        assert mock_request.call_args_list[1].kwargs["params"] == {
+            "filter": "name=repo",
+            "pageToken": "p2",
+        }
+
+    @patch("jules_agent_sdk.sources.Source.from_dict", side_effect=ValueError("bad source"))
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_sources_list_all_stops_on_parse_error(self, mock_request, mock_from_dict):
+        """Test a source that fails to parse stops list_all before the next page."""
+        mock_request.return_value = {
+            "sources": [{"name": "sources/src1", "id": "src1"}],
+            "nextPageToken": "p2",
+        }
+
+        client = JulesClient(api_key="test-api-key")
+        with pytest.raises(ValueError, match="bad source"):
+            client.sources.list_all()
+
+        assert mock_request.call_count == 1
+
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_sources_iter_all_is_lazy(self, mock_request):
+        """Test iter_all only requests pages as they are consumed."""
+        mock_request.side_effect = [
+            {"sources": [{"name": "sources/src1", "id": "src1"}], "nextPageToken": "p2"},
+            {"sources": [{"name": "sources/src2", "id": "src2"}]},
+        ]
+
+        client = JulesClient(api_key="test-api-key")
+        sources = client.sources.iter_all()
+
+        assert next(sources).id == "src1"
+        assert mock_request.call_count == 1
+        assert [s.id for s in sources] == ["src2"]
+        assert mock_request.call_count == 2
+
+    @patch("jules_agent_sdk.base.BaseClient._request")
+    def test_sources_get_accepts_id_or_name(self, mock_request):
+        """Test sources can be fetched by bare ID or full resource name."""
+        mock_request.return_value = {"name": "sources/src1", "id": "src1"}
+
+        client = JulesClient(api_key="test-api-key")
+        client.sources.get("src1")
+        client.sources.get("sources/src1")
+
+        assert [c.args[1] for c in mock_request.call_args_list] == [
+            "sources/src1",
+            "sources/src1",
+        ]
+
 
 class TestErrorHandling:
     """Test error handling."""
@@ -142,10 +431,10 @@ class TestErrorHandling:
     @patch("jules_agent_sdk.base.requests.Session.request")
     def test_authentication_error(self, mock_request):
         """Test authentication error handling."""
-        mock_response = Mock()
+        mock_response = fake_response()
         mock_response.ok = False
         mock_response.status_code = 401
-        mock_response.json.return_value = {"error": {"message": "Invalid API key"}}
+        mock_response.content = b'{"error": {"message": "Invalid API key"}}'
         mock_request.return_value = mock_response
 
         client = JulesClient(api_key="invalid-key")
@@ -156,13 +445,221 @@ class TestErrorHandling:
     @patch("jules_agent_sdk.base.requests.Session.request")
     def test_validation_error(self, mock_request):
         """Test validation error handling."""
-        mock_response = Mock()
+        mock_response = fake_response()
         mock_response.ok = False
         mock_response.status_code = 400
-        mock_response.json.return_value = {"error": {"message": "Invalid request"}}
+        mock_response.content = b'{"error": {"message": "Invalid request"}}'
         mock_request.return_value = mock_response
 
         client = JulesClient(api_key="test-key")
 
         with pytest.raises(JulesValidationError):
             client.sessions.create(prompt="", source="")
+
+    @patch("jules_agent_sdk.base.time.sleep")
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_retryable_status_is_retried(self, mock_request, mock_sleep):
+        """Test 429/5xx responses are retried and later successes returned."""
+        throttled = fake_response(ok=False, status_code=429, headers={})
+        unavailable = fake_response(ok=False, status_code=503, headers={})
+        success = fake_response(ok=True, status_code=200, content=b'{"sources": []}')
+        mock_request.side_effect = [throttled, unavailable, success]
+
+        client = JulesClient(api_key="test-key")
+        result = client.sources.list()
+
+        assert result["sources"] == []
+        assert mock_request.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("jules_agent_sdk.base.time.sleep")
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_rate_limit_honors_retry_after(self, mock_request, mock_sleep):
+        """Test 429 retries wait at least as long as the Retry-After header asks."""
+        throttled = fake_response(ok=False, status_code=429, headers={"Retry-After": "7"})
+        success = fake_response(ok=True, status_code=200, content=b'{"sources": []}')
+        mock_request.side_effect = [throttled, success]
+
+        client = JulesClient(api_key="test-key")
+        client.sources.list()
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_rate_limit_error_carries_retry_after(self, mock_request):
+        """Test an exhausted 429 exposes the server-requested delay."""
+        mock_request.return_value = fake_response(
+            ok=False, status_code=429, headers={"Retry-After": "3"}
+        )
+
+        client = JulesClient(api_key="test-key", max_retries=1)
+
+        with pytest.raises(JulesRateLimitError) as exc_info:
+            client.sources.list()
+        assert exc_info.value.retry_after_seconds == 3.0
+
+    @patch("jules_agent_sdk.base.time.sleep")
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_server_error_raised_after_retries(self, mock_request, mock_sleep):
+        """Test a persistent 5xx is raised once retries are exhausted."""
+        mock_response = fake_response(
+            ok=False,
+            status_code=500,
+            headers={"Content-Type": "application/json"},
+            text="boom",
+        )
+        mock_response.content = b'{"error": {"message": "Internal error"}}'
+        mock_request.return_value = mock_response
+
+        client = JulesClient(api_key="test-key")
+
+        with pytest.raises(JulesAPIError, match="Internal error"):
+            client.sources.list()
+        assert mock_request.call_count == 3
+
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_html_server_error_message_is_truncated(self, mock_request):
+        """Test non-JSON 5xx bodies become a bounded plain-text message."""
+        mock_response = fake_response(
+            ok=False, status_code=502, headers={"Content-Type": "text/html"}
+        )
+        mock_response.content = b"<html>" + b"x" * 10000
+        mock_request.return_value = mock_response
+
+        client = JulesClient(api_key="test-key", max_retries=1)
+
+        with pytest.raises(JulesAPIError) as exc_info:
+            client.sources.list()
+        assert exc_info.value.message.startswith("<html>")
+        assert len(exc_info.value.message) == 4096
+
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_response_body_parsing(self, mock_request):
+        """Test response bodies are parsed from raw bytes."""
+        mock_response = fake_response()
+        mock_response.ok = True
+        mock_response.status_code = 200
+        mock_response.content = b'{"sessions": [], "nextPageToken": "next"}'
+        mock_request.return_value = mock_response
+
+        client = JulesClient(api_key="test-key")
+
+        assert client.sessions.list()["nextPageToken"] == "next"
+
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_invalid_json_response(self, mock_request):
+        """Test malformed response bodies raise JulesAPIError."""
+        mock_response = fake_response()
+        mock_response.ok = True
+        mock_response.status_code = 200
+        mock_response.content = b"not json"
+        mock_request.return_value = mock_response
+
+        client = JulesClient(api_key="test-key")
+
+        with pytest.raises(JulesAPIError, match="Invalid JSON response"):
+            client.sessions.list()
+
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_request_body_is_encoded_json(self, mock_request):
+        """Test POST bodies are sent as pre-encoded JSON bytes."""
+        mock_response = fake_response()
+        mock_response.ok = True
+        mock_response.status_code = 200
+        mock_response.content = b'{"id": "test123"}'
+        mock_request.return_value = mock_response
+
+        client = JulesClient(api_key="test-key")
+        client.sessions.send_message("test123", "Add tests")
+
+        kwargs = mock_request.call_args.kwargs
+        assert json.loads(kwargs["data"]) == {"prompt": "Add tests"}
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_debug_logging_formats_lazily(self, mock_request, caplog):
+        """Test request/response debug logs render once debug logging is enabled."""
+        mock_request.return_value = fake_response(ok=True, status_code=200, content=b"{}")
+
+        client = JulesClient(api_key="test-key")
+        with caplog.at_level("DEBUG", logger="jules_agent_sdk.base"):
+            client._base_client.get("sources")
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert "Request: GET sources" in messages
+        assert "Response: 200" in messages
+
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_conditional_get_reuses_body_on_not_modified(self, mock_request):
+        """Test GETs send If-None-Match once an ETag is known and reuse it on 304."""
+        first = fake_response(ok=True, status_code=200, headers={"ETag": '"v1"'})
+        first.content = b'{"name": "sessions/s1", "id": "s1", "state": "IN_PROGRESS"}'
+        not_modified = fake_response(ok=True, status_code=304, headers={}, content=b"")
+        mock_request.side_effect = [first, not_modified]
+
+        client = JulesClient(api_key="test-key")
+        client._base_client.get("sessions/s1")
+        result = client._base_client.get("sessions/s1")
+
+        assert result["state"] == "IN_PROGRESS"
+        assert mock_request.call_args_list[0].kwargs["headers"] is None
+        assert mock_request.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_conditional_get_skips_lists_and_invalidated_paths(self, mock_request):
+        """Test list pages keep no validator and invalidate() drops a resource's."""
+        mock_request.side_effect = lambda **kwargs: fake_response(
+            ok=True, status_code=200, headers={"ETag": '"v1"'}, content=b'{"id": "s1"}'
+        )
+
+        client = JulesClient(api_key="test-key")
+        client._base_client.get("sessions", params={"pageSize": 10})
+        client._base_client.get("sessions", params={"pageSize": 10})
+        client._base_client.get("sessions/s1")
+        client.cache.invalidate("sessions/s1")
+        client._base_client.get("sessions/s1")
+
+        assert [c.kwargs["headers"] for c in mock_request.call_args_list] == [None] * 4
+
+    def test_cache_keeps_expiring_entries_apart_from_permanent_ones(self):
+        """Test never-expiring activity entries cannot evict session entries."""
+        from jules_agent_sdk.cache import ResponseCache
+
+        cache = ResponseCache(maxsize=2)
+        cache.set("sessions/s1", {"id": "s1"}, 60)
+        for i in range(3):
+            cache.set(f"sessions/s1/activities/a{i}", {"id": f"a{i}"}, float("inf"))
+
+        assert cache.get("sessions/s1") == {"id": "s1"}
+        assert cache.get("sessions/s1/activities/a0") is None
+        assert cache.get("sessions/s1/activities/a2") == {"id": "a2"}
+        assert len(cache) == 3
+
+    @patch("jules_agent_sdk.base.requests.Session.request")
+    def test_request_url_joins_base_url_and_path(self, mock_request):
+        """Test request URLs have exactly one slash between base URL and path."""
+        mock_response = fake_response()
+        mock_response.ok = True
+        mock_response.status_code = 200
+        mock_response.content = b"{}"
+        mock_request.return_value = mock_response
+
+        client = JulesClient(api_key="test-key", base_url="https://example.com/v1/")
+        client._base_client.get("/sources")
+
+        assert mock_request.call_args.kwargs["url"] == "https://example.com/v1/sources"
+
+    def test_exceptions_are_slotted_and_pickle(self):
+        """Test errors keep their details through a pickle round trip."""
+        error = JulesRateLimitError("Slow down", 429, {"error": {}}, retry_after_seconds=2.0)
+        error.note = "kept"
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is JulesRateLimitError
+        assert str(restored) == "Slow down"
+        assert restored.status_code == 429
+        assert restored.response == {"error": {}}
+        assert restored.retry_after_seconds == 2.0
+        assert restored.note == "kept"
+        assert "status_code" not in error.__dict__
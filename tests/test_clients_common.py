@@ -0,0 +1,25 @@
+"""Tests shared by the sync and async Jules clients."""
+
+import pytest
+from jules_agent_sdk import JulesClient, AsyncJulesClient
+
+CLIENT_CLASSES = [
+    pytest.param(JulesClient, marks=pytest.mark.sync),
+    pytest.param(AsyncJulesClient, marks=pytest.mark.asyncio_client),
+]
+
+
+@pytest.mark.parametrize("client_cls", CLIENT_CLASSES)
+def test_client_initialization(client_cls):
+    """Test client initializes correctly."""
+    client = client_cls(api_key="test-api-key")
+    assert client.sessions is not None
+    assert client.activities is not None
+    assert client.sources is not None
+
+
+@pytest.mark.parametrize("client_cls", CLIENT_CLASSES)
+def test_client_requires_api_key(client_cls):
+    """Test client raises error without API key."""
+    with pytest.raises(ValueError, match="API key is required"):
+        client_cls(api_key="")
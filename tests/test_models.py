@@ -1,5 +1,6 @@
 """Tests for data models."""
 
+import pickle
 import pytest
 from jules_agent_sdk.models import (
     Session,
@@ -7,8 +8,15 @@ from jules_agent_sdk.models import (
     Source,
     GitHubRepo,
     Activity,
+    Artifact,
     SourceContext,
     GitHubRepoContext,
+    GitHubBranch,
+    SessionOutput,
+    Plan,
+    ChangeSet,
+    Media,
+    BashOutput,
 )
 
 
@@ -27,13 +35,24 @@ class TestModels:
             },
             "state": "IN_PROGRESS",
             "title": "Bug Fix Session",
+            "requirePlanApproval": True,
+            "createTime": "2024-01-01T00:00:00Z",
+            "updateTime": "2024-01-02T00:00:00Z",
+            "url": "https://jules.google.com/session/test123",
+            "outputs": [{"pullRequest": {"url": "pr-url", "title": "PR", "description": "d"}}],
         }
 
         session = Session.from_dict(data)
+        assert session.name == "sessions/test123"
         assert session.id == "test123"
         assert session.prompt == "Fix bug"
-        assert session.state == SessionState.IN_PROGRESS
+        assert session.state is SessionState.IN_PROGRESS
         assert session.title == "Bug Fix Session"
+        assert session.require_plan_approval is True
+        assert session.create_time == "2024-01-01T00:00:00Z"
+        assert session.update_time == "2024-01-02T00:00:00Z"
+        assert session.url == "https://jules.google.com/session/test123"
+        assert session.outputs[0].pull_request.url == "pr-url"
         assert session.source_context.source == "sources/repo1"
         assert session.source_context.github_repo_context.starting_branch == "main"
 
@@ -91,12 +110,138 @@ class TestModels:
         assert activity.originator == "agent"
         assert activity.agent_messaged == {"agentMessage": "I fixed the bug"}
 
-    def test_session_state_enum(self):
+    def test_activity_originator_is_interned(self):
+        """Test activities parsed separately share one originator string."""
+        first = Activity.from_dict({"name": "a1", "originator": "".join(["ag", "ent"])})
+        second = Activity.from_dict({"name": "a2", "originator": "".join(["ag", "ent"])})
+        assert first.originator == "agent"
+        assert first.originator is second.originator
+
+    def test_artifact_from_dict(self):
+        """Test Artifact.from_dict() parses the payload it carries and ignores the rest."""
+        artifact = Artifact.from_dict(
+            {"bashOutput": {"command": "ls", "exitCode": 0}, "media": {}, "extra": 1}
+        )
+        assert artifact.bash_output.command == "ls"
+        assert artifact.media is None
+        assert artifact.change_set is None
+        assert artifact.to_dict() == {"bashOutput": artifact.bash_output.to_dict()}
+
+    def test_activity_uses_slots(self):
+        """Test Activity instances are slotted and reject unknown attributes."""
+        activity = Activity.from_dict(
+            {"name": "sessions/s1/activities/a1", "artifacts": [{"media": {"data": "x"}}]}
+        )
+        assert not hasattr(activity, "__dict__")
+        assert not hasattr(activity.artifacts[0], "__dict__")
+        with pytest.raises(AttributeError):
+            activity.unknown = "value"
+
+    def test_session_uses_slots_and_pickles(self):
+        """Test Session instances are slotted and survive a pickle round trip."""
+        session = Session.from_dict(
+            {
+                "name": "sessions/s1",
+                "id": "s1",
+                "prompt": "Fix bug",
+                "sourceContext": {
+                    "source": "sources/repo1",
+                    "githubRepoContext": {"startingBranch": "main"},
+                },
+                "state": "COMPLETED",
+            }
+        )
+        assert not hasattr(session, "__dict__")
+        assert not hasattr(session.source_context, "__dict__")
+        assert pickle.loads(pickle.dumps(session)) == session
+
+    def test_session_hashes_by_id(self):
+        """Test sessions can be used in sets while equality compares all fields."""
+        base = {"name": "sessions/s1", "id": "s1", "prompt": "Fix bug", "sourceContext": {}}
+        queued = Session.from_dict({**base, "state": "QUEUED"})
+        done = Session.from_dict({**base, "state": "COMPLETED"})
+
+        assert hash(queued) == hash(done)
+        assert queued != done
+        assert len({queued, Session.from_dict({**base, "state": "QUEUED"}), done}) == 2
+
+    def test_session_unknown_state_is_unspecified(self):
+        """Test unknown or missing states parse as STATE_UNSPECIFIED."""
+        base = {"prompt": "Fix bug", "sourceContext": {"source": "sources/repo1"}}
+
+        assert Session.from_dict({**base, "state": "NEW_STATE"}).state is (
+            SessionState.STATE_UNSPECIFIED
+        )
+        assert Session.from_dict(base).state is SessionState.STATE_UNSPECIFIED
+        assert Session.from_dict({**base, "state": "PAUSED"}).state is SessionState.PAUSED
+
+    @pytest.mark.parametrize(
+        "state, value",
+        [
+            (SessionState.QUEUED, "QUEUED"),
+            (SessionState.IN_PROGRESS, "IN_PROGRESS"),
+            (SessionState.COMPLETED, "COMPLETED"),
+            (SessionState.FAILED, "FAILED"),
+        ],
+    )
+    def test_session_state_enum(self, state, value):
         """Test SessionState enum values."""
-        assert SessionState.QUEUED.value == "QUEUED"
-        assert SessionState.IN_PROGRESS.value == "IN_PROGRESS"
-        assert SessionState.COMPLETED.value == "COMPLETED"
-        assert SessionState.FAILED.value == "FAILED"
+        assert state.value == value
+        assert SessionState(value) is state
+
+    @pytest.mark.parametrize(
+        "cls, data",
+        [
+            (GitHubBranch, {"displayName": "main"}),
+            (
+                GitHubRepo,
+                {
+                    "owner": "o",
+                    "repo": "r",
+                    "isPrivate": True,
+                    "defaultBranch": {"displayName": "main"},
+                    "branches": [{"displayName": "dev"}],
+                },
+            ),
+            (
+                Source,
+                {
+                    "name": "sources/s1",
+                    "id": "s1",
+                    "githubRepo": {"owner": "o", "repo": "r", "isPrivate": False},
+                },
+            ),
+            (
+                SourceContext,
+                {"source": "sources/s1", "githubRepoContext": {"startingBranch": "main"}},
+            ),
+            (SessionOutput, {"pullRequest": {"url": "u", "title": "t", "description": "d"}}),
+            (
+                Plan,
+                {
+                    "id": "p1",
+                    "steps": [{"id": "1", "title": "t", "description": "d", "index": 2}],
+                    "createTime": "c",
+                },
+            ),
+            (
+                ChangeSet,
+                {
+                    "source": "sources/s1",
+                    "gitPatch": {
+                        "unidiffPatch": "diff",
+                        "baseCommitId": "abc",
+                        "suggestedCommitMessage": "msg",
+                    },
+                },
+            ),
+            (Media, {"data": "x", "mimeType": "image/png"}),
+            (BashOutput, {"command": "ls", "output": "out", "exitCode": 1}),
+        ],
+    )
+    def test_from_dict_to_dict_round_trip(self, cls, data):
+        """Test every field lands in the right attribute and serializes back unchanged."""
+        assert cls.from_dict(data).to_dict() == data
 
     def test_github_repo_serialization(self):
         """Test GitHubRepo serialization roundtrip."""